@@ -1,89 +1,61 @@
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.auth_deps import get_current_user
-from app.db.database import get_db
+from app.core.response_cache import word_list_cache
+from app.core.security import password_hasher
+from app.core.stats import get_activity_series
+from app.core.stats import get_dashboard_stats as compute_dashboard_stats
+from app.core.user_cache import user_cache
+from app.db.database import engine, get_db, get_pool_stats
 from app.models.user import User
 from app.models.word import Word
-from app.schemas.admin import DashboardStats, RecentContent, RecentUser
+from app.schemas.admin import (
+    ActivitySeries,
+    CacheStats,
+    DashboardStats,
+    PasswordHashingStats,
+    PoolStats,
+    RecentContent,
+    RecentUser,
+    ResponseCacheStats,
+)
 
 router = APIRouter(tags=["admin"])
 
 
 @router.get("/stats", response_model=DashboardStats)
-async def get_dashboard_stats(
+def get_dashboard_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    # Get total users
-    total_users = db.query(User).count()
+    return DashboardStats(**compute_dashboard_stats(db))
 
-    # Get active users (users who have logged in within the last 30 days)
-    now = datetime.now(UTC)
-    thirty_days_ago = now - timedelta(days=30)
-    active_users = (
-        db.query(User)
-        .filter(User.last_login >= thirty_days_ago.replace(tzinfo=None))
-        .count()
-    )
-
-    # Get total content (words)
-    total_content = db.query(Word).count()
-
-    # Calculate user growth
-    first_day_current_month = now.replace(
-        day=1, hour=0, minute=0, second=0, microsecond=0
-    )
-    first_day_prev_month = (
-        first_day_current_month - timedelta(days=1)
-    ).replace(day=1)
-
-    # Count users created in current month
-    current_month_users = (
-        db.query(User)
-        .filter(
-            User.created_at >= first_day_current_month.replace(tzinfo=None)
-        )
-        .count()
-    )
-
-    # Count users created in previous month
-    prev_month_users = (
-        db.query(User)
-        .filter(
-            User.created_at >= first_day_prev_month.replace(tzinfo=None),
-            User.created_at < first_day_current_month.replace(tzinfo=None),
-        )
-        .count()
-    )
-
-    # Calculate growth percentage
-    user_growth = (
-        ((current_month_users - prev_month_users) / prev_month_users * 100)
-        if prev_month_users > 0
-        else 100 if current_month_users > 0 else 0
-    )
 
-    # Calculate content growth (mock data for now)
-    content_growth = 25  # This should be calculated based on historical data
+@router.get("/analytics", response_model=ActivitySeries)
+def get_analytics(
+    interval: str = Query("day", pattern="^(day|week)$"),
+    days: int = Query(30, ge=1, le=366),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
 
-    return DashboardStats(
-        total_users=total_users,
-        active_users=active_users,
-        total_content=total_content,
-        user_growth=round(user_growth, 1),  # Round to 1 decimal place
-        content_growth=content_growth,
+    return ActivitySeries(
+        interval=interval,
+        points=get_activity_series(db, interval=interval, days=days),
     )
 
 
 @router.get("/users", response_model=List[RecentUser])
-async def get_recent_users(
+def get_recent_users(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -116,7 +88,7 @@ async def get_recent_users(
 
 
 @router.get("/content", response_model=List[RecentContent])
-async def get_recent_content(
+def get_recent_content(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -138,3 +110,43 @@ async def get_recent_content(
         )
         for word in recent_words
     ]
+
+
+@router.get("/metrics/db-pool", response_model=PoolStats)
+async def get_db_pool_metrics(
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    return PoolStats(**get_pool_stats(engine.pool))
+
+
+@router.get("/metrics/user-cache", response_model=CacheStats)
+async def get_user_cache_metrics(
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    return CacheStats(**user_cache.stats())
+
+
+@router.get("/metrics/response-cache", response_model=ResponseCacheStats)
+async def get_response_cache_metrics(
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    return ResponseCacheStats(**word_list_cache.stats())
+
+
+@router.get("/metrics/password-hashing", response_model=PasswordHashingStats)
+async def get_password_hashing_metrics(
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    return PasswordHashingStats(**password_hasher.stats())
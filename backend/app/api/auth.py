@@ -8,10 +8,12 @@ from sqlalchemy.orm import Session
 
 from app.api.auth_deps import get_current_user
 from app.core.security import (
+    PasswordHasherBusyError,
     create_access_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
+from app.core.stats import record_activity
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.user import Token
@@ -27,6 +29,14 @@ def get_user_by_email(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
 
 
+def hashing_busy_exception():
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserSchema)
 def register(user: UserCreate, db: Session = Depends(get_db)):
     logger.info(f"Attempting to register user with email: {user.email}")
@@ -41,7 +51,10 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
             detail="Email already exists",
         )
 
-    hashed_password = get_password_hash(user.password)
+    try:
+        hashed_password = get_password_hash(user.password)
+    except PasswordHasherBusyError:
+        raise hashing_busy_exception()
     db_user = User(
         email=user.email, hashed_password=hashed_password, role=user.role
     )
@@ -69,17 +82,28 @@ def login(
     db: Session = Depends(get_db),
 ):
     user = get_user_by_email(db, email=form_data.username)
-    if not user or not verify_password(
-        form_data.password, user.hashed_password
-    ):
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = verify_and_update_password(
+                form_data.password, user.hashed_password
+            )
+        except PasswordHasherBusyError:
+            raise hashing_busy_exception()
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Upgrade hashes made with an outdated work factor
+    if new_hash:
+        user.hashed_password = new_hash
+
     # Update last_login timestamp
     user.last_login = datetime.now(UTC)
+    record_activity(db, logins=1)
     db.commit()
 
     access_token_expires = timedelta(minutes=30)
@@ -7,13 +7,14 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.security import ALGORITHM
+from app.core.user_cache import cache_user, get_cached_user
 from app.db.database import get_db
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
 
-async def get_current_user(
+def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Session = Depends(get_db),
 ) -> User:
@@ -32,9 +33,14 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
+    user = get_cached_user(email)
+    if user is not None:
+        return user
+
     user = db.query(User).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
+    cache_user(user)
     return user
 
 
@@ -0,0 +1,141 @@
+from datetime import UTC, datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.auth_deps import get_current_user
+from app.api.words import flashcard_columns
+from app.core.srs import review_card
+from app.db.database import get_db
+from app.db.upsert import insert_missing
+from app.models.review_card import ReviewCard
+from app.models.user import User
+from app.models.word import ApprovalStatus
+from app.models.word import Word as DBWord
+from app.schemas.review import (
+    DueCard,
+    ReviewBatch,
+    ReviewBatchResult,
+    ReviewOutcome,
+)
+
+router = APIRouter()
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Review times are stored as naive UTC like every other timestamp
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+@router.get("/due", response_model=List[DueCard])
+def get_due_cards(
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Most overdue first: a range scan of ix_review_cards_user_id_due_at,
+    # joined to each card's word by primary key
+    rows = db.execute(
+        select(
+            *flashcard_columns(),
+            ReviewCard.due_at,
+            ReviewCard.interval_days,
+            ReviewCard.repetitions,
+        )
+        .join(DBWord, DBWord.id == ReviewCard.word_id)
+        .where(
+            ReviewCard.user_id == current_user.id,
+            ReviewCard.due_at <= datetime.utcnow(),
+        )
+        .order_by(ReviewCard.due_at)
+        .limit(limit)
+    ).all()
+    return [DueCard(**row._mapping) for row in rows]
+
+
+@router.post("", response_model=ReviewBatchResult)
+def submit_reviews(
+    batch: ReviewBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Record a batch of graded reviews and reschedule their cards.
+
+    Reviewing a word for the first time enrolls it. Reviews are applied
+    in the order they were answered, so one batch may grade the same
+    card more than once.
+    """
+    now = datetime.utcnow()
+    word_ids = {review.word_id for review in batch.reviews}
+
+    def lock_cards(ids):
+        return {
+            card.word_id: card
+            for card in db.scalars(
+                select(ReviewCard)
+                .where(
+                    ReviewCard.user_id == current_user.id,
+                    ReviewCard.word_id.in_(ids),
+                )
+                .with_for_update()
+            )
+        }
+
+    cards = lock_cards(word_ids)
+    new_word_ids = word_ids - cards.keys()
+    if new_word_ids:
+        # A concurrent batch may enroll the same words first; its cards
+        # are kept, locked and reviewed after it commits
+        insert_missing(
+            db,
+            ReviewCard.__table__,
+            [
+                {"user_id": current_user.id, "word_id": word_id}
+                for word_id in db.scalars(
+                    select(DBWord.id).where(
+                        DBWord.id.in_(new_word_ids),
+                        DBWord.approval_status == ApprovalStatus.APPROVED,
+                    )
+                )
+            ],
+            ["user_id", "word_id"],
+        )
+        cards.update(lock_cards(new_word_ids))
+
+    reviews = sorted(
+        batch.reviews,
+        key=lambda review: _as_utc(review.reviewed_at or now),
+    )
+    for review in reviews:
+        card = cards.get(review.word_id)
+        if card is not None:
+            reviewed_at = min(_as_utc(review.reviewed_at or now), now)
+            review_card(card, review.grade, reviewed_at)
+
+    results = []
+    for review in batch.reviews:
+        card = cards.get(review.word_id)
+        if card is None:
+            results.append(
+                ReviewOutcome(word_id=review.word_id, status="not_found")
+            )
+        else:
+            results.append(
+                ReviewOutcome(
+                    word_id=review.word_id,
+                    status="reviewed",
+                    due_at=card.due_at,
+                    interval_days=card.interval_days,
+                )
+            )
+    # Outcomes are read before committing, which expires the cards
+    db.commit()
+    return ReviewBatchResult(
+        reviewed=sum(result.status == "reviewed" for result in results),
+        results=results,
+    )
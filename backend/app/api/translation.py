@@ -1,10 +1,15 @@
 import logging
-from typing import Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.core.translation import translate_to_english, translate_to_greek
+from app.core.translation import (
+    translate_texts,
+    translate_to_english,
+    translate_to_greek,
+    translation_cache,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -18,6 +23,25 @@ class TranslationResponse(BaseModel):
     translated_text: Optional[str]
 
 
+class BatchTranslationRequest(BaseModel):
+    texts: List[str] = Field(min_length=1, max_length=100)
+    target_language: Literal["el", "en"]
+
+
+class BatchTranslationResponse(BaseModel):
+    translations: List[Optional[str]]
+
+
+class TranslationCacheStats(BaseModel):
+    memory_hits: int
+    persistent_hits: int
+    misses: int
+    memory_size: int
+    memory_max_size: int
+    memory_evictions: int
+    hit_ratio: float
+
+
 @router.post("/to-greek", response_model=TranslationResponse)
 async def translate_to_greek_endpoint(request: TranslationRequest):
     """Translate text to Greek."""
@@ -68,3 +92,33 @@ async def translate_to_english_endpoint(request: TranslationRequest):
         raise HTTPException(
             status_code=500, detail=f"Translation failed: {str(e)}"
         )
+
+
+@router.post("/batch", response_model=BatchTranslationResponse)
+async def translate_batch_endpoint(request: BatchTranslationRequest):
+    """Translate many texts with a single upstream request."""
+    if not all(text.strip() for text in request.texts):
+        raise HTTPException(
+            status_code=400,
+            detail="Text cannot be empty",
+        )
+    try:
+        logger.info(
+            f"Translating {len(request.texts)} text(s) to "
+            f"{request.target_language}"
+        )
+        translations = await translate_texts(
+            request.texts, request.target_language
+        )
+        return BatchTranslationResponse(translations=translations)
+    except Exception as e:
+        logger.error(f"Error translating batch: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Translation failed: {str(e)}"
+        )
+
+
+@router.get("/cache/stats", response_model=TranslationCacheStats)
+async def get_translation_cache_stats():
+    """Report hit/miss statistics of the translation cache."""
+    return TranslationCacheStats(**translation_cache.stats())
@@ -1,31 +1,124 @@
 from datetime import UTC, datetime
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, exists, or_, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.api.auth_deps import get_current_admin_user, get_current_user
+from app.core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
+from app.core.exporter import MEDIA_TYPES, export_words
+from app.core.importer import PARSERS, import_words_file
+from app.core.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from app.core.response_cache import word_list_cache
+from app.core.sampling import sample_ids
+from app.core.search import word_search_filter, word_search_rank
+from app.core.stats import record_activity
 from app.db.database import get_db
+from app.models.deleted_word import DeletedWord
+from app.models.dictionary_version import (
+    get_dictionary_version,
+    mark_dictionary_changed,
+)
 from app.models.meaning import Meaning as DBMeaning
+from app.models.review_card import ReviewCard
 from app.models.user import User
 from app.models.word import ApprovalStatus
 from app.models.word import Word as DBWord
-from app.schemas.word import Word, WordCreate
+from app.schemas.word import (
+    Flashcard,
+    Word,
+    WordBulkModerationRequest,
+    WordBulkModerationResult,
+    WordChanges,
+    WordCreate,
+    WordImportResult,
+    WordModerationOutcome,
+    WordPatch,
+    WordUpdate,
+)
 
 
 class PaginatedResponse(BaseModel):
     items: List[Word]
-    total: int
+    total: Optional[int]
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 router = APIRouter()
 
 
+def word_load_options(meanings: bool = True, submitter: bool = True):
+    """
+    Loader options for the relationships serialized by the Word schema.
+
+    Collections use selectinload so a page of words costs one extra query
+    rather than one lazy load per row; the many-to-one submitter is joined.
+    """
+    options = []
+    if submitter:
+        options.append(joinedload(DBWord.submitter))
+    if meanings:
+        options.append(selectinload(DBWord.meanings))
+    return options
+
+
+def word_filters(
+    current_user: User,
+    search: Optional[str] = None,
+    match: str = "contains",
+    word_type: Optional[str] = None,
+    gender: Optional[str] = None,
+    include_pending: bool = False,
+) -> list:
+    """
+    Build the WHERE conditions shared by the word listing and the export.
+    """
+    conditions = []
+
+    # Apply search filter
+    if search:
+        conditions.append(word_search_filter(search, match))
+
+    # Apply word type filter
+    if word_type:
+        conditions.append(DBWord.word_type == word_type.lower())
+
+    # Apply gender filter
+    if gender:
+        conditions.append(DBWord.gender == gender.lower())
+
+    # Filter by approval status
+    if not include_pending or current_user.role != "admin":
+        conditions.append(DBWord.approval_status == ApprovalStatus.APPROVED)
+
+    return conditions
+
+
 @router.post("/", response_model=Word)
 def create_word(
     word: WordCreate,
@@ -73,67 +166,562 @@ def create_word(
     return db_word
 
 
+@router.post("/import", response_model=WordImportResult)
+def import_words(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(
+        None, alias="format", pattern="^(csv|jsonl)$"
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    # Fall back to the file extension when no format is given
+    file_format = file_format or (file.filename or "").rsplit(".", 1)[-1]
+    if file_format.lower() not in PARSERS:
+        raise HTTPException(
+            status_code=400,
+            detail="Unsupported file format, expected csv or jsonl",
+        )
+
+    return import_words_file(
+        db, file.file, file_format.lower(), created_by=current_user.id
+    )
+
+
 @router.get("/", response_model=PaginatedResponse)
 def read_words(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(50, ge=1, le=100),
     search: Optional[str] = None,
+    match: str = Query("contains", pattern="^(contains|prefix|exact)$"),
     word_type: Optional[str] = None,
     gender: Optional[str] = None,
     include_pending: bool = False,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    sort: str = Query("greek_word", pattern="^(greek_word|relevance)$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    query = db.query(DBWord).options(joinedload(DBWord.submitter))
+    ranked = sort == "relevance" and bool(search)
+    if ranked and cursor:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported with relevance sort",
+        )
 
-    # Apply search filter
-    if search:
-        search_term = f"%{search.lower()}%"
+    # Listings without pending words only change with the approved part of
+    # the dictionary, so pending submissions leave them cached
+    approved_only = not include_pending or current_user.role != "admin"
+    state = get_dictionary_version(db)
+    etag = make_etag(
+        "words",
+        "approved" if approved_only else "all",
+        state.approved_version if approved_only else state.version,
+        page,
+        size,
+        search,
+        match,
+        word_type.lower() if word_type else None,
+        gender.lower() if gender else None,
+        cursor,
+        include_total,
+        sort,
+    )
+    # Clients that already hold the page are answered before any query,
+    # and the serialized page is shared by every client asking for it
+    if is_not_modified(request, etag, state.updated_at):
+        return not_modified_response(etag, state.updated_at)
+    body = word_list_cache.get(etag)
+    if body is None:
+        body = (
+            list_words(
+                db,
+                current_user,
+                page=page,
+                size=size,
+                search=search,
+                match=match,
+                word_type=word_type,
+                gender=gender,
+                include_pending=include_pending,
+                cursor=cursor,
+                include_total=include_total,
+                ranked=ranked,
+            )
+            .model_dump_json()
+            .encode("utf-8")
+        )
+        word_list_cache.set(etag, body)
+
+    response = Response(content=body, media_type="application/json")
+    set_validators(response, etag, state.updated_at)
+    return response
+
+
+def list_words(
+    db: Session,
+    current_user: User,
+    page: int,
+    size: int,
+    search: Optional[str],
+    match: str,
+    word_type: Optional[str],
+    gender: Optional[str],
+    include_pending: bool,
+    cursor: Optional[str],
+    include_total: bool,
+    ranked: bool,
+) -> PaginatedResponse:
+    """Query one page of the word listing served by read_words."""
+    query = (
+        db.query(DBWord)
+        .options(*word_load_options())
+        .filter(
+            *word_filters(
+                current_user,
+                search=search,
+                match=match,
+                word_type=word_type,
+                gender=gender,
+                include_pending=include_pending,
+            )
+        )
+    )
+
+    # Counting repeats the whole filtered query, so clients walking pages
+    # with a cursor can opt out of it
+    total = query.count() if include_total else None
+    pages = (total + size - 1) // size if total is not None else None
+
+    if ranked:
+        rank = word_search_rank(search, db.get_bind().dialect.name)
+        query = query.order_by(rank.desc(), DBWord.greek_word, DBWord.id)
+    else:
+        query = query.order_by(DBWord.greek_word, DBWord.id)
+
+    if cursor:
+        # Keyset pagination: seek past the last row of the previous page
+        # instead of scanning and discarding OFFSET rows
+        try:
+            last_greek_word, last_id = decode_cursor(cursor, 2)
+            if not isinstance(last_greek_word, str) or not isinstance(
+                last_id, int
+            ):
+                raise InvalidCursorError("Invalid cursor")
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         query = query.filter(
             or_(
-                DBWord.greek_word.ilike(search_term),
-                DBWord.notes.ilike(search_term),
-                DBWord.meanings.any(
-                    DBMeaning.english_meaning.ilike(search_term)
+                DBWord.greek_word > last_greek_word,
+                and_(
+                    DBWord.greek_word == last_greek_word,
+                    DBWord.id > last_id,
                 ),
             )
         )
+    else:
+        query = query.offset((page - 1) * size)
 
-    # Apply word type filter
-    if word_type:
-        query = query.filter(DBWord.word_type == word_type.lower())
+    # Fetch one extra row to know whether another page follows
+    words = query.limit(size + 1).all()
+    next_cursor = None
+    if len(words) > size:
+        words = words[:size]
+        if not ranked:
+            next_cursor = encode_cursor(words[-1].greek_word, words[-1].id)
 
-    # Apply gender filter
-    if gender:
-        query = query.filter(DBWord.gender == gender.lower())
+    return PaginatedResponse(
+        items=words,
+        total=total,
+        page=page,
+        size=size,
+        pages=pages,
+        next_cursor=next_cursor,
+    )
 
-    # Filter by approval status
-    if not include_pending or current_user.role != "admin":
-        query = query.filter(DBWord.approval_status == ApprovalStatus.APPROVED)
 
-    # Get total count
-    total = query.count()
+@router.get("/export")
+def export_words_stream(
+    file_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$"
+    ),
+    search: Optional[str] = None,
+    match: str = Query("contains", pattern="^(contains|prefix|exact)$"),
+    word_type: Optional[str] = None,
+    gender: Optional[str] = None,
+    include_pending: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    conditions = word_filters(
+        current_user,
+        search=search,
+        match=match,
+        word_type=word_type,
+        gender=gender,
+        include_pending=include_pending,
+    )
+
+    # The request session is closed before the body is streamed, so the
+    # stream reads through its own session, which it closes when done
+    export_db = Session(bind=db.get_bind())
+    return StreamingResponse(
+        export_words(export_db, conditions, file_format),
+        media_type=MEDIA_TYPES[file_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="words.{file_format}"'
+            )
+        },
+    )
 
-    # Calculate pagination
-    skip = (page - 1) * size
-    pages = (total + size - 1) // size  # Ceiling division
 
-    # Apply ordering and pagination
-    words = query.order_by(DBWord.greek_word).offset(skip).limit(size).all()
+def flashcard_columns() -> list:
+    """
+    The columns of the Flashcard schema, selected from words.
 
-    return PaginatedResponse(
-        items=words, total=total, page=page, size=size, pages=pages
+    Cards only show the primary meaning, picked by a correlated subquery
+    so a deck costs a single query.
+    """
+    meaning = (
+        select(DBMeaning.english_meaning)
+        .where(DBMeaning.word_id == DBWord.id)
+        .order_by(DBMeaning.is_primary.desc(), DBMeaning.id)
+        .limit(1)
+        .scalar_subquery()
     )
+    return [
+        DBWord.id,
+        DBWord.greek_word,
+        DBWord.word_type,
+        DBWord.gender,
+        DBWord.notes,
+        meaning.label("meaning"),
+    ]
+
+
+@router.get("/flashcards", response_model=List[Flashcard])
+def get_flashcards(
+    count: int = Query(20, ge=1, le=100),
+    word_type: Optional[str] = None,
+    gender: Optional[str] = None,
+    unseen: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    conditions = word_filters(current_user, word_type=word_type, gender=gender)
+    if unseen:
+        # Leave out words the user already studies with spaced repetition
+        conditions.append(
+            ~exists().where(
+                ReviewCard.user_id == current_user.id,
+                ReviewCard.word_id == DBWord.id,
+            )
+        )
+    word_ids = sample_ids(db, DBWord.id, count, conditions)
+    if not word_ids:
+        return []
+
+    rows = db.execute(
+        select(*flashcard_columns()).where(DBWord.id.in_(word_ids))
+    ).all()
+    cards = {row.id: Flashcard(**row._mapping) for row in rows}
+    return [cards[word_id] for word_id in word_ids if word_id in cards]
+
 
+@router.get("/changes", response_model=WordChanges)
+def get_word_changes(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    include_pending: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Words changed since a sync token, for clients keeping a local copy.
+
+    Without a token every word is returned. Words come in the order of
+    the dictionary version that last changed them, with the token of the
+    next call; keep calling while has_more is set. Deleted words, and
+    words the caller may no longer see, are listed by id in deleted.
+    """
+    last_version, last_id = 0, None
+    if since:
+        try:
+            last_version, last_id = decode_cursor(since, 2)
+            if not isinstance(last_version, int) or not isinstance(
+                last_id, (int, type(None))
+            ):
+                raise ValueError(since)
+        except (InvalidCursorError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid sync token")
+
+    # Changes committed while the feed is read are left for the next call
+    current_version = get_dictionary_version(db).version
+    query = (
+        select(DBWord)
+        .options(*word_load_options())
+        .where(DBWord.sync_version <= current_version)
+    )
+    if since:
+        newer = DBWord.sync_version > last_version
+        if last_id is not None:
+            newer = or_(
+                newer,
+                and_(DBWord.sync_version == last_version, DBWord.id > last_id),
+            )
+        query = query.where(newer)
+    words = db.scalars(
+        query.order_by(DBWord.sync_version, DBWord.id).limit(limit + 1)
+    ).all()
+
+    has_more = len(words) > limit
+    words = words[:limit]
+    if has_more:
+        end_version = words[-1].sync_version
+        next_token = encode_cursor(end_version, words[-1].id)
+    else:
+        end_version = current_version
+        next_token = encode_cursor(current_version, None)
+
+    # A page ending inside a version already carried its tombstones
+    deleted = []
+    if since:
+        deleted = db.scalars(
+            select(DeletedWord.word_id)
+            .where(
+                DeletedWord.sync_version > last_version,
+                DeletedWord.sync_version <= end_version,
+            )
+            .order_by(DeletedWord.sync_version, DeletedWord.word_id)
+        ).all()
+
+    show_pending = include_pending and current_user.role == "admin"
+    visible, hidden = [], []
+    for word in words:
+        if show_pending or word.approval_status == ApprovalStatus.APPROVED:
+            visible.append(word)
+        else:
+            hidden.append(word.id)
+    return WordChanges(
+        words=visible,
+        deleted=[*deleted, *hidden],
+        next_token=next_token,
+        has_more=has_more,
+    )
 
-@router.get("/pending", response_model=List[Word])
-def get_pending_words(db: Session = Depends(get_db)):
-    return (
+
+@router.get("/pending", response_model=PaginatedResponse)
+def get_pending_words(
+    size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    # Oldest submissions first, served by ix_words_approval_status_created_at
+    query = (
         db.query(DBWord)
-        .options(joinedload(DBWord.submitter))
+        .options(*word_load_options())
         .filter(DBWord.approval_status == ApprovalStatus.PENDING)
-        .all()
     )
+    total = query.count() if include_total else None
+
+    if cursor:
+        try:
+            last_created_at, last_id = decode_cursor(cursor, 2)
+            if not isinstance(last_id, int):
+                raise ValueError(cursor)
+            last_created_at = datetime.fromisoformat(last_created_at)
+        except (InvalidCursorError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            or_(
+                DBWord.created_at > last_created_at,
+                and_(
+                    DBWord.created_at == last_created_at,
+                    DBWord.id > last_id,
+                ),
+            )
+        )
+
+    words = query.order_by(DBWord.created_at, DBWord.id).limit(size + 1).all()
+    next_cursor = None
+    if len(words) > size:
+        words = words[:size]
+        next_cursor = encode_cursor(
+            words[-1].created_at.isoformat(), words[-1].id
+        )
+
+    return PaginatedResponse(
+        items=words,
+        total=total,
+        page=1,
+        size=size,
+        pages=(total + size - 1) // size if total is not None else None,
+        next_cursor=next_cursor,
+    )
+
+
+def moderate_words(
+    db: Session,
+    request: WordBulkModerationRequest,
+    approval_status: ApprovalStatus,
+    current_user: User,
+) -> WordBulkModerationResult:
+    """
+    Set the approval status of many words with one UPDATE ... RETURNING.
+
+    The statement also returns the previous status of every row, read by
+    a materialized CTE before the rows change, so only words that were
+    not approved before count as approvals.
+    """
+    # RETURNING columns are not qualified on SQLite, so the id is renamed
+    # to tell it apart from the updated row's
+    selected = select(DBWord.id.label("word_id"), DBWord.approval_status)
+    if request.ids is not None:
+        selected = selected.where(DBWord.id.in_(request.ids))
+    else:
+        # Filters only ever select from the moderation queue
+        selected = selected.where(
+            DBWord.approval_status == ApprovalStatus.PENDING,
+            *word_filters(
+                current_user,
+                search=request.filter.search,
+                match=request.filter.match,
+                word_type=request.filter.word_type,
+                gender=request.filter.gender,
+                include_pending=True,
+            ),
+        )
+        if request.filter.created_by is not None:
+            selected = selected.where(
+                DBWord.created_by == request.filter.created_by
+            )
+    previous = selected.cte("previous").prefix_with("MATERIALIZED")
+
+    rows = db.execute(
+        update(DBWord)
+        # Reading the CTE here materializes it before the update
+        .where(DBWord.id.in_(select(previous.c.word_id)))
+        .values(approval_status=approval_status)
+        .returning(
+            DBWord.id,
+            select(previous.c.approval_status)
+            .where(previous.c.word_id == DBWord.id)
+            .scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    updated_ids = {word_id for word_id, _ in rows}
+    previous_statuses = [was for _, was in rows]
+    if updated_ids:
+        mark_dictionary_changed(
+            db,
+            approved=ApprovalStatus.APPROVED
+            in (approval_status, *previous_statuses),
+            word_ids=updated_ids,
+        )
+    if approval_status == ApprovalStatus.APPROVED:
+        record_activity(
+            db,
+            approvals=sum(
+                was != ApprovalStatus.APPROVED for was in previous_statuses
+            ),
+        )
+    db.commit()
+
+    requested_ids = (
+        request.ids if request.ids is not None else sorted(updated_ids)
+    )
+    return WordBulkModerationResult(
+        approval_status=approval_status,
+        updated=len(updated_ids),
+        results=[
+            WordModerationOutcome(
+                id=word_id,
+                status="updated" if word_id in updated_ids else "not_found",
+            )
+            for word_id in dict.fromkeys(requested_ids)
+        ],
+    )
+
+
+@router.post("/bulk/approve", response_model=WordBulkModerationResult)
+def bulk_approve_words(
+    request: WordBulkModerationRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    return moderate_words(db, request, ApprovalStatus.APPROVED, current_user)
+
+
+@router.post("/bulk/reject", response_model=WordBulkModerationResult)
+def bulk_reject_words(
+    request: WordBulkModerationRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    return moderate_words(db, request, ApprovalStatus.REJECTED, current_user)
+
+
+def set_approval_status(
+    db: Session, word_id: int, approval_status: ApprovalStatus
+) -> Optional[DBWord]:
+    """
+    Write the approval status of a word with one UPDATE ... RETURNING.
+
+    The word's columns come from the statement's result, so the row is
+    not read before or after the write. The statement also returns the
+    previous status, read by a materialized CTE before the row changes,
+    which tells whether the change is visible to users. The meanings
+    and submitter of the returned word are loaded by their own SELECTs,
+    and the dictionary version is bumped when the caller commits.
+
+    Returns:
+        The updated word, or None if it does not exist
+    """
+    previous = (
+        select(DBWord.id, DBWord.approval_status)
+        .where(DBWord.id == word_id)
+        .cte("previous")
+        .prefix_with("MATERIALIZED")
+    )
+    previous_status = (
+        select(previous.c.approval_status)
+        .scalar_subquery()
+        .label("previous_status")
+    )
+    statement = (
+        update(DBWord)
+        # Reading the CTE here materializes it before the update
+        .where(DBWord.id.in_(select(previous.c.id)))
+        .values(approval_status=approval_status)
+        .returning(DBWord, previous_status)
+    )
+    row = db.execute(
+        select(DBWord, previous_status)
+        .from_statement(statement)
+        .options(selectinload(DBWord.meanings), selectinload(DBWord.submitter))
+        .execution_options(populate_existing=True)
+    ).first()
+    if row is None:
+        return None
+
+    db_word, was = row
+    mark_dictionary_changed(
+        db,
+        approved=ApprovalStatus.APPROVED in (was, approval_status),
+        word_ids=[word_id],
+    )
+    if (
+        approval_status == ApprovalStatus.APPROVED
+        and was != ApprovalStatus.APPROVED
+    ):
+        record_activity(db, approvals=1)
+    return db_word
 
 
 @router.post("/{word_id}/approve", response_model=Word)
@@ -142,14 +730,14 @@ def approve_word(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
-    db_word = db.query(DBWord).filter(DBWord.id == word_id).first()
+    db_word = set_approval_status(db, word_id, ApprovalStatus.APPROVED)
     if db_word is None:
         raise HTTPException(status_code=404, detail="Word not found")
 
-    db_word.approval_status = ApprovalStatus.APPROVED
+    # Serialized before committing, which would expire the loaded word
+    response = Word.model_validate(db_word)
     db.commit()
-    db.refresh(db_word)
-    return db_word
+    return response
 
 
 @router.post("/{word_id}/reject", response_model=Word)
@@ -158,25 +746,34 @@ def reject_word(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
-    db_word = db.query(DBWord).filter(DBWord.id == word_id).first()
+    db_word = set_approval_status(db, word_id, ApprovalStatus.REJECTED)
     if db_word is None:
         raise HTTPException(status_code=404, detail="Word not found")
 
-    db_word.approval_status = ApprovalStatus.REJECTED
+    response = Word.model_validate(db_word)
     db.commit()
-    db.refresh(db_word)
-    return db_word
+    return response
 
 
 @router.get("/{word_id}", response_model=Word)
 def read_word(
     word_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    state = get_dictionary_version(db)
+    etag = make_etag(
+        "word", state.version, current_user.role == "admin", word_id
+    )
+    if is_not_modified(request, etag, state.updated_at):
+        return not_modified_response(etag, state.updated_at)
+    set_validators(response, etag, state.updated_at)
+
     db_word = (
         db.query(DBWord)
-        .options(joinedload(DBWord.submitter))
+        .options(*word_load_options())
         .filter(DBWord.id == word_id)
         .first()
     )
@@ -195,13 +792,60 @@ def read_word(
     return db_word
 
 
-@router.put("/{word_id}", response_model=Word)
-def update_word(
-    word_id: int,
-    word: WordCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+def apply_word_changes(db_word: DBWord, changes: dict):
+    """
+    Write the given fields of a word, diffing its meanings by id.
+
+    Only values that differ are assigned, so the flush updates just the
+    changed columns. Meanings with an id are updated in place, meanings
+    without one are added and the word's other meanings are deleted;
+    the unit of work batches each kind into one statement.
+
+    Args:
+        db_word: The word to change
+        changes: JSON-compatible field values, meanings as a list of dicts
+
+    Raises:
+        HTTPException: If a meaning id does not belong to the word
+    """
+    meanings = changes.pop("meanings", None)
+    for field, value in changes.items():
+        if getattr(db_word, field) != value:
+            setattr(db_word, field, value)
+    if meanings is None:
+        return
+
+    existing = {meaning.id: meaning for meaning in db_word.meanings}
+    sent_ids = [m["id"] for m in meanings if m.get("id") is not None]
+    if len(set(sent_ids)) != len(sent_ids) or not existing.keys() >= set(
+        sent_ids
+    ):
+        raise HTTPException(
+            status_code=400,
+            detail="Meaning ids must be unique and belong to the word",
+        )
+
+    kept = []
+    for meaning in meanings:
+        meaning_id = meaning.pop("id", None)
+        if meaning_id is None:
+            kept.append(DBMeaning(**meaning))
+            continue
+        db_meaning = existing[meaning_id]
+        for field, value in meaning.items():
+            if getattr(db_meaning, field) != value:
+                setattr(db_meaning, field, value)
+        kept.append(db_meaning)
+
+    # Replacing the collection only when its members change keeps a
+    # no-op edit from dirtying the word; dropped meanings are orphans
+    if len(kept) != len(existing) or len(sent_ids) != len(existing):
+        db_word.meanings = kept
+
+
+def edit_word(
+    db: Session, word_id: int, changes: dict, current_user: User
+) -> DBWord:
     db_word = db.query(DBWord).filter(DBWord.id == word_id).first()
     if db_word is None:
         raise HTTPException(status_code=404, detail="Word not found")
@@ -215,65 +859,74 @@ def update_word(
             status_code=403, detail="Not authorized to update approved words"
         )
 
-    # Convert enum values to lowercase for database compatibility
-    word_type_value = (
-        word.word_type.value
-        if hasattr(word.word_type, "value")
-        else str(word.word_type).lower()
-    )
-    gender_value = (
-        word.gender.value
-        if word.gender and hasattr(word.gender, "value")
-        else str(word.gender).lower() if word.gender else None
-    )
-
-    # Update word properties
-    db_word.greek_word = word.greek_word
-    db_word.word_type = word_type_value
-    db_word.gender = gender_value
-    db_word.notes = word.notes
+    apply_word_changes(db_word, changes)
 
     # Set approval status based on user role
-    if current_user.role == "admin":
-        db_word.approval_status = ApprovalStatus.APPROVED
-    else:
-        db_word.approval_status = ApprovalStatus.PENDING
-
-    # Delete existing meanings
-    db.query(DBMeaning).filter(DBMeaning.word_id == word_id).delete()
-
-    # Create new meanings
-    for meaning in word.meanings:
-        db_meaning = DBMeaning(
-            english_meaning=meaning.english_meaning,
-            is_primary=meaning.is_primary,
-            word_id=word_id,
-        )
-        db.add(db_meaning)
+    approval_status = (
+        ApprovalStatus.APPROVED
+        if current_user.role == "admin"
+        else ApprovalStatus.PENDING
+    )
+    if db_word.approval_status != approval_status:
+        db_word.approval_status = approval_status
+        if approval_status == ApprovalStatus.APPROVED:
+            record_activity(db, approvals=1)
 
     db.commit()
     db.refresh(db_word)
     return db_word
 
 
+@router.put("/{word_id}", response_model=Word)
+def update_word(
+    word_id: int,
+    word: WordUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return edit_word(
+        db,
+        word_id,
+        word.model_dump(mode="json", exclude={"approval_status"}),
+        current_user,
+    )
+
+
+@router.patch("/{word_id}", response_model=Word)
+def patch_word(
+    word_id: int,
+    word: WordPatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    # Fields left out of the payload are left untouched
+    return edit_word(
+        db,
+        word_id,
+        word.model_dump(mode="json", exclude_unset=True),
+        current_user,
+    )
+
+
 @router.delete("/{word_id}", response_model=Dict[str, bool])
 def delete_word(
     word_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
 ):
-    # First, check if the word exists
-    db_word = db.query(DBWord).filter(DBWord.id == word_id).first()
-    if db_word is None:
+    # The database deletes the meanings through ON DELETE CASCADE
+    deleted_id = db.scalar(
+        delete(DBWord)
+        .where(DBWord.id == word_id)
+        .returning(DBWord.id)
+        .execution_options(synchronize_session=False)
+    )
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Word not found"
         )
 
-    # Delete all meanings associated with the word
-    db.query(DBMeaning).filter(DBMeaning.word_id == word_id).delete()
-
-    # Delete the word
-    db.delete(db_word)
+    mark_dictionary_changed(db, deleted_word_ids=[deleted_id])
     db.commit()
 
     return {"success": True}
@@ -0,0 +1,71 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+# Clients may cache word responses but must revalidate them every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Build a weak ETag from the values a response depends on."""
+    digest = hashlib.sha1(
+        "\x1f".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> bool:
+    """
+    Evaluate If-None-Match and If-Modified-Since against a response.
+
+    If-Modified-Since is only looked at when If-None-Match is absent, as
+    RFC 9110 requires.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag for tag in if_none_match.split(",") if tag.strip()]
+        return any(
+            tag.strip() == "*" or _weak(tag) == _weak(etag) for tag in tags
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        modified = last_modified.replace(tzinfo=UTC, microsecond=0)
+        return modified <= since
+    return False
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime]
+):
+    """Attach the ETag, Last-Modified and Cache-Control headers."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            last_modified.replace(tzinfo=UTC), usegmt=True
+        )
+
+
+def not_modified_response(
+    etag: str, last_modified: Optional[datetime]
+) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -14,13 +14,57 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
 
+    # Database connection pool settings
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Worker threads running sync route handlers and dependencies
+    THREADPOOL_SIZE: int = 40
+
     # JWT settings
     SECRET_KEY: str = "your-secret-key-here"  # Change this in production!
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Password hashing: bcrypt work factor and the dedicated pool running it
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 8
+
+    # Cache of users resolved from token subjects
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # Cache of serialized word listings; set RESPONSE_CACHE_REDIS_URL to
+    # share it between workers (requires the "redis" package)
+    RESPONSE_CACHE_MAX_SIZE: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0
+    RESPONSE_CACHE_REDIS_URL: str = ""
+
+    # How often the daily_stats rollup behind the admin dashboard is
+    # refreshed by each worker; 0 disables the refresh
+    DAILY_STATS_REFRESH_SECONDS: float = 300.0
+
     # Google Translate API settings
     GOOGLE_TRANSLATE_API_KEY: str = ""
+    GOOGLE_TRANSLATE_API_URL: str = (
+        "https://translation.googleapis.com/language/translate/v2"
+    )
+
+    # Shared HTTP client used for translation requests
+    TRANSLATION_HTTP_MAX_CONNECTIONS: int = 20
+    TRANSLATION_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    TRANSLATION_HTTP2: bool = False  # requires the "h2" package
+    TRANSLATION_HTTP_TIMEOUT_SECONDS: float = 10.0
+    TRANSLATION_MAX_RETRIES: int = 2
+    TRANSLATION_RETRY_BACKOFF_SECONDS: float = 0.5
+
+    # Translation cache: in-process LRU tier and persistent database tier
+    TRANSLATION_CACHE_MAX_SIZE: int = 4096
+    TRANSLATION_CACHE_TTL_SECONDS: int = 30 * 24 * 60 * 60
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.importer import CSV_MEANING_SEPARATOR
+from app.models.word import Word
+
+DEFAULT_BATCH_SIZE = 500
+
+CSV_COLUMNS = ["id", "greek_word", "word_type", "gender", "notes", "meanings"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _word_dict(word: Word) -> dict:
+    # Same shape as the importer's JSONL rows, plus the id, so an export
+    # can be imported back as is
+    return {
+        "id": word.id,
+        "greek_word": word.greek_word,
+        "word_type": word.word_type,
+        "gender": word.gender,
+        "notes": word.notes,
+        "meanings": [
+            {
+                "english_meaning": meaning.english_meaning,
+                "is_primary": meaning.is_primary,
+            }
+            for meaning in sorted(
+                word.meanings, key=lambda m: (not m.is_primary, m.id)
+            )
+        ],
+    }
+
+
+def format_ndjson(words: Iterable[Word]) -> Iterator[str]:
+    for word in words:
+        yield json.dumps(_word_dict(word), ensure_ascii=False) + "\n"
+
+
+def format_csv(words: Iterable[Word]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow(CSV_COLUMNS)
+    yield flush()
+    for word in words:
+        data = _word_dict(word)
+        writer.writerow(
+            [
+                data["id"],
+                data["greek_word"],
+                data["word_type"],
+                data["gender"] or "",
+                data["notes"] or "",
+                CSV_MEANING_SEPARATOR.join(
+                    m["english_meaning"] for m in data["meanings"]
+                ),
+            ]
+        )
+        yield flush()
+
+
+FORMATTERS = {"ndjson": format_ndjson, "csv": format_csv}
+
+
+def iter_words(
+    db: Session, conditions: list, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Word]:
+    """
+    Iterate over the words matching the conditions in greek_word order.
+
+    Rows are fetched batch_size at a time from a server-side cursor, with
+    the meanings of each batch loaded in one extra query, and every batch
+    is expunged once consumed so memory stays flat however large the
+    dictionary is.
+    """
+    result = db.scalars(
+        select(Word)
+        .options(selectinload(Word.meanings))
+        .where(*conditions)
+        .order_by(Word.greek_word, Word.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for partition in result.partitions():
+        yield from partition
+        for word in partition:
+            db.expunge(word)
+
+
+def export_words(
+    db: Session,
+    conditions: list,
+    file_format: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Stream the matching words as NDJSON or CSV text chunks.
+
+    The session is closed when the stream is exhausted or abandoned.
+    """
+    try:
+        yield from FORMATTERS[file_format](
+            iter_words(db, conditions, batch_size)
+        )
+    finally:
+        db.close()
@@ -0,0 +1,24 @@
+import unicodedata
+from typing import Optional
+
+
+def normalize_greek(text: Optional[str]) -> Optional[str]:
+    """
+    Build the accent- and case-insensitive search key for a greek word.
+
+    Strips tonos, dialytika and any other combining marks, lowercases the
+    text and folds final sigma, so "Καλημέρα" and "καλημερα" share a key.
+
+    Args:
+        text: The text to normalize
+
+    Returns:
+        The normalized text, or None if no text was given
+    """
+    if text is None:
+        return None
+    decomposed = unicodedata.normalize("NFD", text.strip())
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return unicodedata.normalize("NFC", stripped).lower().replace("ς", "σ")
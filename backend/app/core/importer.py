@@ -0,0 +1,251 @@
+import argparse
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.greek import normalize_greek
+from app.core.stats import record_activity
+from app.db.database import SessionLocal
+from app.models.dictionary_version import mark_dictionary_changed
+from app.models.meaning import Meaning
+from app.models.word import ApprovalStatus, Word
+from app.schemas.word import WordCreate, WordImportError, WordImportResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Only the first errors are reported back; the count covers all of them
+MAX_REPORTED_ERRORS = 1000
+
+# CSV rows list meanings in one column, separated by semicolons, with the
+# primary meaning first
+CSV_MEANING_SEPARATOR = ";"
+
+ParsedRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[ParsedRow]:
+    """
+    Parse CSV rows with greek_word, word_type, gender, notes and meanings
+    columns.
+
+    Yields:
+        Tuples of (line number, raw word data or None, parse error or None)
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        meanings = [
+            meaning.strip()
+            for meaning in (row.get("meanings") or "").split(
+                CSV_MEANING_SEPARATOR
+            )
+            if meaning.strip()
+        ]
+        yield reader.line_num, {
+            "greek_word": (row.get("greek_word") or "").strip() or None,
+            "word_type": (row.get("word_type") or "").lower(),
+            "gender": (row.get("gender") or "").lower() or None,
+            "notes": row.get("notes") or None,
+            "meanings": [
+                {"english_meaning": meaning, "is_primary": index == 0}
+                for index, meaning in enumerate(meanings)
+            ],
+        }, None
+
+
+def parse_jsonl(lines: Iterable[str]) -> Iterator[ParsedRow]:
+    """
+    Parse one JSON word object per line, in the WordCreate format.
+
+    Yields:
+        Tuples of (line number, raw word data or None, parse error or None)
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+
+
+PARSERS = {"csv": parse_csv, "jsonl": parse_jsonl}
+
+
+def _chunks(rows: Iterator[ParsedRow], size: int) -> Iterator[List[ParsedRow]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _insert_chunk(
+    db: Session,
+    words: List[WordCreate],
+    created_by: Optional[int],
+    approval_status: ApprovalStatus,
+):
+    now = datetime.utcnow()
+    word_ids = db.scalars(
+        insert(Word).returning(Word.id, sort_by_parameter_order=True),
+        [
+            {
+                "greek_word": word.greek_word,
+                "greek_word_normalized": normalize_greek(word.greek_word),
+                "word_type": word.word_type.value,
+                "gender": word.gender.value if word.gender else None,
+                "notes": word.notes,
+                "approval_status": approval_status.value,
+                "created_by": created_by,
+                "created_at": now,
+            }
+            for word in words
+        ],
+    ).all()
+    meaning_rows = [
+        {
+            "word_id": word_id,
+            "english_meaning": meaning.english_meaning,
+            "is_primary": meaning.is_primary,
+        }
+        for word_id, word in zip(word_ids, words)
+        for meaning in word.meanings
+    ]
+    if meaning_rows:
+        db.execute(insert(Meaning), meaning_rows)
+    mark_dictionary_changed(
+        db,
+        approved=approval_status == ApprovalStatus.APPROVED,
+        word_ids=word_ids,
+    )
+
+
+def import_words(
+    db: Session,
+    rows: Iterable[ParsedRow],
+    created_by: Optional[int] = None,
+    approval_status: ApprovalStatus = ApprovalStatus.APPROVED,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> WordImportResult:
+    """
+    Bulk insert parsed words and their meanings in batched transactions.
+
+    Rows are validated one by one and invalid rows are reported without
+    aborting the import. Valid rows are written chunk by chunk with
+    executemany inserts and one commit per chunk; a chunk the database
+    rejects is rolled back and reported, and the import moves on.
+
+    Args:
+        db: The database session
+        rows: Rows produced by one of the parsers
+        created_by: The id of the user submitting the words
+        approval_status: The approval status given to imported words
+        chunk_size: The number of rows written per transaction
+
+    Returns:
+        The number of imported and failed rows, with the first errors
+    """
+    result = WordImportResult(imported=0, failed=0, errors=[])
+
+    def fail(line: int, error: str):
+        result.failed += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(WordImportError(line=line, error=error))
+
+    for chunk in _chunks(iter(rows), chunk_size):
+        lines, words = [], []
+        for line, raw, error in chunk:
+            if error is None:
+                try:
+                    words.append(WordCreate.model_validate(raw))
+                    lines.append(line)
+                    continue
+                except ValidationError as e:
+                    error = "; ".join(
+                        f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+                        for err in e.errors()
+                    )
+            fail(line, error)
+
+        if not words:
+            continue
+        try:
+            _insert_chunk(db, words, created_by, approval_status)
+            if approval_status == ApprovalStatus.APPROVED:
+                record_activity(db, approvals=len(words))
+            db.commit()
+            result.imported += len(words)
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"Word import chunk failed: {str(e)}")
+            for line in lines:
+                fail(line, "Database error while writing this chunk")
+
+    return result
+
+
+def import_words_file(
+    db: Session,
+    file: IO[bytes],
+    file_format: str,
+    **kwargs,
+) -> WordImportResult:
+    """Stream a CSV or JSONL file of words into the database."""
+    lines = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        return import_words(db, PARSERS[file_format](lines), **kwargs)
+    finally:
+        lines.detach()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bulk import words from a CSV or JSONL file."
+    )
+    parser.add_argument("path", help="The CSV or JSONL file to import")
+    parser.add_argument("--format", choices=sorted(PARSERS))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--pending",
+        action="store_true",
+        help="Import the words as pending instead of approved",
+    )
+    args = parser.parse_args()
+
+    file_format = args.format or args.path.rsplit(".", 1)[-1].lower()
+    if file_format not in PARSERS:
+        parser.error("Cannot infer the file format, pass --format")
+
+    with open(args.path, "rb") as file, SessionLocal() as db:
+        result = import_words_file(
+            db,
+            file,
+            file_format,
+            approval_status=(
+                ApprovalStatus.PENDING
+                if args.pending
+                else ApprovalStatus.APPROVED
+            ),
+            chunk_size=args.chunk_size,
+        )
+
+    print(f"Imported {result.imported} words, {result.failed} failed")
+    for error in result.errors:
+        print(f"  line {error.line}: {error.error}")
+
+
+if __name__ == "__main__":
+    main()
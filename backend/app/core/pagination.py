@@ -0,0 +1,36 @@
+import base64
+import json
+from typing import Any, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, length: int) -> Tuple[Any, ...]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: The opaque cursor string sent by the client
+        length: The number of values the cursor is expected to hold
+
+    Returns:
+        The decoded sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursorError("Invalid cursor")
+    return tuple(values)
@@ -0,0 +1,147 @@
+import logging
+import threading
+from typing import Optional, Protocol
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheBackend(Protocol):
+    """Storage for serialized responses, keyed by opaque strings."""
+
+    name: str
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes): ...
+
+    def clear(self): ...
+
+    def stats(self) -> dict: ...
+
+
+class MemoryBackend:
+    """Per-process LRU backend."""
+
+    name = "memory"
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.entries = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: bytes):
+        self.entries.set(key, value)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        stats = self.entries.stats()
+        return {"size": stats["size"], "max_size": stats["max_size"]}
+
+
+class RedisBackend:
+    """
+    Backend shared by every worker, stored in Redis.
+
+    Requires the "redis" package. Entries expire after the TTL; there is
+    no size bound beyond the Redis server's own eviction policy.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, ttl_seconds: float, prefix: str = "words:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, ttl_seconds: float) -> "RedisBackend":
+        import redis
+
+        return cls(redis.Redis.from_url(url), ttl_seconds)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes):
+        self.client.set(
+            self.prefix + key, value, ex=max(1, int(self.ttl_seconds))
+        )
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def stats(self) -> dict:
+        return {"size": None, "max_size": None}
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses in front of a pluggable backend.
+
+    Keys are expected to embed the dictionary version they were computed
+    from, so entries are never invalidated in place: a write bumps the
+    version and later lookups simply use new keys, on every worker at
+    once. Backend errors are logged and treated as misses.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.error(f"Response cache read failed: {str(e)}")
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes):
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            logger.error(f"Response cache write failed: {str(e)}")
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "backend": self.backend.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+        return {**stats, **self.backend.stats()}
+
+
+def create_backend() -> ResponseCacheBackend:
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        return RedisBackend.from_url(
+            settings.RESPONSE_CACHE_REDIS_URL,
+            settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+    return MemoryBackend(
+        max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+# Serialized word listings, keyed by visibility, version and query
+word_list_cache = ResponseCache(create_backend())
@@ -0,0 +1,96 @@
+import random
+from typing import List
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session
+
+# Probes per missing row in each round, and rounds before falling back to
+# sorting by random() for sparse filters or small tables
+PROBES_PER_ROW = 2
+MAX_PROBES = 200
+MAX_ROUNDS = 3
+
+
+def sample_ids(
+    db: Session,
+    id_column,
+    count: int,
+    conditions: list = (),
+    rng: random.Random = random,
+) -> List[int]:
+    """
+    Pick up to count random ids of rows matching the conditions.
+
+    Instead of sorting the whole table by random(), random values are
+    drawn between the smallest and largest matching id and each probe
+    seeks the first matching row at or after its value, wrapping around
+    to the first matching row before it, all probes of a round in one
+    UNION ALL statement. Every probe is a primary key index seek, so the
+    cost follows count rather than the table size. Rows following a gap
+    in the ids are slightly more likely to be picked. When the rounds
+    still come up short, the remaining ids are drawn by sorting the
+    matching rows that were not picked by random().
+
+    Args:
+        db: The session to query with
+        id_column: The integer primary key column to sample
+        count: How many distinct ids to return at most
+        conditions: Filters the sampled rows must match
+        rng: The random number generator to draw probes from
+
+    Returns:
+        Distinct ids in random order; fewer than count only when fewer
+        rows match
+    """
+    low, high = db.execute(
+        select(func.min(id_column), func.max(id_column)).where(*conditions)
+    ).one()
+    if low is None:
+        return []
+
+    def first_id(*where):
+        return (
+            select(id_column)
+            .where(*where, *conditions)
+            .order_by(id_column)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    def probe():
+        value = rng.randint(low, high)
+        return select(
+            func.coalesce(
+                first_id(id_column >= value), first_id(id_column < value)
+            )
+        )
+
+    found = {}
+    for _ in range(MAX_ROUNDS):
+        missing = count - len(found)
+        if missing <= 0:
+            break
+        probes = [
+            probe() for _ in range(min(missing * PROBES_PER_ROW, MAX_PROBES))
+        ]
+        for row_id in db.scalars(union_all(*probes)):
+            if row_id is not None:
+                found.setdefault(row_id, None)
+
+    missing = count - len(found)
+    if missing > 0:
+        # Probes keep drawing the same rows when few rows match
+        found.update(
+            dict.fromkeys(
+                db.scalars(
+                    select(id_column)
+                    .where(id_column.not_in(list(found)), *conditions)
+                    .order_by(func.random())
+                    .limit(missing)
+                )
+            )
+        )
+
+    ids = list(found)[:count]
+    rng.shuffle(ids)
+    return ids
@@ -0,0 +1,74 @@
+from sqlalchemy import case, func, literal, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.greek import normalize_greek
+from app.models.meaning import Meaning
+from app.models.word import Word
+
+
+def word_search_filter(term: str, match: str = "contains") -> ColumnElement:
+    """
+    Build the predicate matching words against a search term.
+
+    Greek words are compared on their normalized key, so accents and case
+    do not matter. `exact` and `prefix` only look at the greek word and seek
+    its btree index. `contains` also searches the notes and the english
+    meanings; on PostgreSQL those substring predicates are served by the
+    pg_trgm GIN indexes declared on the models.
+
+    Args:
+        term: The search term
+        match: One of "contains", "prefix" or "exact"
+
+    Returns:
+        A SQL expression usable in WHERE
+    """
+    key = normalize_greek(term)
+    if match == "exact":
+        return Word.greek_word_normalized == key
+    if match == "prefix":
+        return Word.greek_word_normalized.like(f"{key}%")
+
+    pattern = f"%{term.lower()}%"
+    return or_(
+        Word.greek_word_normalized.like(f"%{key}%"),
+        Word.notes.ilike(pattern),
+        Word.meanings.any(Meaning.english_meaning.ilike(pattern)),
+    )
+
+
+def word_search_rank(term: str, dialect_name: str) -> ColumnElement:
+    """
+    Build a relevance score for words matching a search term.
+
+    Higher is better. PostgreSQL ranks by trigram similarity across the
+    greek word, the notes and the best matching meaning. Other databases
+    use a portable exact > prefix > substring ranking on the greek word.
+
+    Args:
+        term: The search term
+        dialect_name: The name of the SQLAlchemy dialect in use
+
+    Returns:
+        A SQL expression usable in ORDER BY
+    """
+    key = normalize_greek(term)
+    if dialect_name == "postgresql":
+        term = term.lower()
+        meaning_similarity = (
+            select(func.max(func.similarity(Meaning.english_meaning, term)))
+            .where(Meaning.word_id == Word.id)
+            .scalar_subquery()
+        )
+        return func.greatest(
+            func.similarity(Word.greek_word_normalized, key),
+            func.coalesce(func.similarity(Word.notes, term), 0),
+            func.coalesce(meaning_similarity, 0),
+        )
+
+    return case(
+        (Word.greek_word_normalized == key, literal(3)),
+        (Word.greek_word_normalized.like(f"{key}%"), literal(2)),
+        (Word.greek_word_normalized.like(f"%{key}%"), literal(1)),
+        else_=literal(0),
+    )
@@ -1,13 +1,21 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. Hashes made with a different work factor are flagged
+# by pwd_context.needs_update and upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # JWT settings
 SECRET_KEY = settings.SECRET_KEY
@@ -15,6 +23,93 @@ ALGORITHM = settings.ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
 
+class PasswordHasherBusyError(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool is enough
+    to cap the CPU spent on it. Callers beyond max_pending are rejected
+    immediately, which bounds how many request threads a login storm can
+    tie up waiting for a hash.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time_total = 0.0
+        self.run_time_total = 0.0
+
+    def run(self, func: Callable, *args: Any) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            self.pending += 1
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+                self.wait_time_total += started - submitted
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.pending -= 1
+                    self.completed += 1
+                    self.run_time_total += time.perf_counter() - started
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            # The task never ran, so give its slot back
+            with self._lock:
+                self.pending -= 1
+            raise
+        return future.result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_time_avg_seconds": (
+                    self.wait_time_total / self.completed
+                    if self.completed
+                    else 0.0
+                ),
+                "run_time_avg_seconds": (
+                    self.run_time_total / self.completed
+                    if self.completed
+                    else 0.0
+                ),
+            }
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
 def create_access_token(
     subject: Union[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
@@ -30,8 +125,25 @@ def create_access_token(
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(
+        pwd_context.verify, plain_password, hashed_password
+    )
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash is out of date.
+
+    Returns:
+        Whether the password matched, and the replacement hash to store if
+        the current one was made with an outdated work factor
+    """
+    return password_hasher.run(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
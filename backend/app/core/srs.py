@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# Grades run from 0 (blackout) to 5 (perfect recall); below this the
+# card is relearned from the start
+PASSING_GRADE = 3
+
+
+class Schedule(NamedTuple):
+    repetitions: int
+    interval_days: int
+    ease_factor: float
+    lapses: int
+
+
+def next_schedule(schedule: Schedule, grade: int) -> Schedule:
+    """
+    Schedule a card after a review graded 0 to 5, following SM-2.
+
+    Args:
+        schedule: The card's schedule before the review
+        grade: How well the word was recalled
+
+    Returns:
+        The card's schedule after the review
+    """
+    repetitions, interval_days, ease_factor, lapses = schedule
+    if grade < PASSING_GRADE:
+        repetitions, interval_days, lapses = 0, 1, lapses + 1
+    else:
+        repetitions += 1
+        if repetitions == 1:
+            interval_days = 1
+        elif repetitions == 2:
+            interval_days = 6
+        else:
+            interval_days = round(interval_days * ease_factor)
+
+    miss = 5 - grade
+    ease_factor = max(
+        MIN_EASE, ease_factor + 0.1 - miss * (0.08 + miss * 0.02)
+    )
+    return Schedule(repetitions, interval_days, ease_factor, lapses)
+
+
+def review_card(card, grade: int, reviewed_at: datetime):
+    """Apply a review to a ReviewCard and move its due date."""
+    schedule = next_schedule(
+        Schedule(
+            card.repetitions or 0,
+            card.interval_days or 0,
+            card.ease_factor or DEFAULT_EASE,
+            card.lapses or 0,
+        ),
+        grade,
+    )
+    card.repetitions = schedule.repetitions
+    card.interval_days = schedule.interval_days
+    card.ease_factor = schedule.ease_factor
+    card.lapses = schedule.lapses
+    card.last_reviewed_at = reviewed_at
+    card.due_at = reviewed_at + timedelta(days=schedule.interval_days)
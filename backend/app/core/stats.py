@@ -0,0 +1,342 @@
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, func, select, true
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.db.upsert import increment, upsert
+from app.models.daily_stats import DailyStats
+from app.models.user import User
+from app.models.word import Word
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_USER_DAYS = 30
+
+# Rows written by the rollup, as opposed to rows only holding counters
+# incremented on write for a day that has not been rolled up yet
+ROLLED_UP = DailyStats.refreshed_at.isnot(None)
+
+
+def _as_date(value) -> date:
+    # SQLite returns date() results as ISO strings
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def _counts_by_day(db: Session, column, start: datetime, end: datetime):
+    day = func.date(column)
+    rows = db.execute(
+        select(day, func.count())
+        .where(column >= start, column < end)
+        .group_by(day)
+    ).all()
+    return {_as_date(row[0]): row[1] for row in rows}
+
+
+def refresh_daily_stats(db: Session, today: Optional[date] = None) -> int:
+    """
+    Roll up every closed day since the last refresh into daily_stats.
+
+    The most recent rolled-up day is recomputed as well, to pick up rows
+    that were committed after it was first rolled up.
+
+    Args:
+        db: The session to refresh with; the refresh is committed
+        today: The current UTC day, which is still open and not rolled up
+
+    Returns:
+        The number of days written
+    """
+    today = today or datetime.utcnow().date()
+    last_day = db.scalar(select(func.max(DailyStats.day)).where(ROLLED_UP))
+    if last_day is not None:
+        start_day = _as_date(last_day)
+    else:
+        first_created = [
+            db.scalar(select(func.min(User.created_at))),
+            db.scalar(select(func.min(Word.created_at))),
+        ]
+        first_created = [value for value in first_created if value]
+        if not first_created:
+            return 0
+        start_day = min(first_created).date()
+    if start_day >= today:
+        return 0
+
+    start, end = _start_of(start_day), _start_of(today)
+    new_users = _counts_by_day(db, User.created_at, start, end)
+    new_words = _counts_by_day(db, Word.created_at, start, end)
+    total_users = db.scalar(
+        select(func.count()).select_from(User).where(User.created_at < start)
+    )
+    total_words = db.scalar(
+        select(func.count()).select_from(Word).where(Word.created_at < start)
+    )
+
+    now = datetime.utcnow()
+    rows = []
+    day = start_day
+    while day < today:
+        total_users += new_users.get(day, 0)
+        total_words += new_words.get(day, 0)
+        rows.append(
+            {
+                "day": day,
+                "new_users": new_users.get(day, 0),
+                "new_words": new_words.get(day, 0),
+                "total_users": total_users,
+                "total_words": total_words,
+                "refreshed_at": now,
+            }
+        )
+        day += timedelta(days=1)
+
+    upsert(
+        db,
+        DailyStats.__table__,
+        rows,
+        index_elements=["day"],
+        update_columns=[
+            "new_users",
+            "new_words",
+            "total_users",
+            "total_words",
+            "refreshed_at",
+        ],
+    )
+    db.commit()
+    return len(rows)
+
+
+def _growth(current: int, previous: int) -> float:
+    if previous > 0:
+        return round((current - previous) / previous * 100, 1)
+    return 100.0 if current > 0 else 0.0
+
+
+def get_dashboard_stats(db: Session, now: Optional[datetime] = None) -> Dict:
+    """
+    Compute the admin dashboard figures from the daily_stats rollup.
+
+    Closed days come from one aggregate over the rollup, and the rows
+    created since the last rolled-up day from one aggregate over the
+    created_at ranges of users and words, so the cost does not grow with
+    the size of either table.
+    """
+    now = now or datetime.utcnow()
+    month_start = _start_of(now.date().replace(day=1))
+    prev_month_start = _start_of(
+        (month_start - timedelta(days=1)).date().replace(day=1)
+    )
+    in_month = DailyStats.day >= month_start.date()
+    in_prev_month = and_(
+        DailyStats.day >= prev_month_start.date(),
+        DailyStats.day < month_start.date(),
+    )
+
+    latest = (
+        select(DailyStats)
+        .where(ROLLED_UP)
+        .order_by(DailyStats.day.desc())
+        .limit(1)
+    )
+    rollup = db.execute(
+        select(
+            func.max(DailyStats.day).filter(ROLLED_UP),
+            func.coalesce(func.sum(DailyStats.new_users).filter(in_month), 0),
+            func.coalesce(
+                func.sum(DailyStats.new_users).filter(in_prev_month), 0
+            ),
+            func.coalesce(func.sum(DailyStats.new_words).filter(in_month), 0),
+            func.coalesce(
+                func.sum(DailyStats.new_words).filter(in_prev_month), 0
+            ),
+            latest.with_only_columns(DailyStats.total_users).scalar_subquery(),
+            latest.with_only_columns(DailyStats.total_words).scalar_subquery(),
+        )
+    ).one()
+    (
+        last_day,
+        month_users,
+        prev_month_users,
+        month_words,
+        prev_month_words,
+        total_users,
+        total_words,
+    ) = rollup
+
+    # Everything after the last rolled-up day is counted live
+    def live_counts(column):
+        query = select(
+            func.count(),
+            func.count().filter(column >= month_start),
+            func.count().filter(
+                and_(column >= prev_month_start, column < month_start)
+            ),
+        )
+        if last_day is not None:
+            query = query.where(
+                column >= _start_of(_as_date(last_day) + timedelta(days=1))
+            )
+        return query.subquery()
+
+    user_counts = live_counts(User.created_at)
+    word_counts = live_counts(Word.created_at)
+    active_users = (
+        select(func.count())
+        .select_from(User)
+        .where(User.last_login >= now - timedelta(days=ACTIVE_USER_DAYS))
+        .scalar_subquery()
+    )
+    live = db.execute(
+        select(user_counts, word_counts, active_users).join_from(
+            user_counts, word_counts, true()
+        )
+    ).one()
+    (
+        live_users,
+        live_month_users,
+        live_prev_month_users,
+        live_words,
+        live_month_words,
+        live_prev_month_words,
+        active,
+    ) = live
+
+    return {
+        "total_users": (total_users or 0) + live_users,
+        "active_users": active,
+        "total_content": (total_words or 0) + live_words,
+        "user_growth": _growth(
+            month_users + live_month_users,
+            prev_month_users + live_prev_month_users,
+        ),
+        "content_growth": _growth(
+            month_words + live_month_words,
+            prev_month_words + live_prev_month_words,
+        ),
+    }
+
+
+def record_activity(
+    db: Session,
+    logins: int = 0,
+    approvals: int = 0,
+    day: Optional[date] = None,
+):
+    """
+    Count logins and approvals towards today's daily_stats row.
+
+    The increment joins the caller's transaction and is committed with it.
+    """
+    counts = {
+        name: value
+        for name, value in (("logins", logins), ("approvals", approvals))
+        if value
+    }
+    if counts:
+        increment(
+            db,
+            DailyStats.__table__,
+            {"day": day or datetime.utcnow().date()},
+            counts,
+        )
+
+
+def get_activity_series(
+    db: Session,
+    interval: str = "day",
+    days: int = 30,
+    now: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    Signups, logins, word submissions and approvals per day or week.
+
+    Rolled-up days are read from daily_stats; signups and submissions of
+    the days since the last rollup are counted live over created_at.
+
+    Args:
+        db: The session to query with
+        interval: "day" or "week"; weeks start on Monday
+        days: How many days back from today the series covers
+        now: The current UTC time
+
+    Returns:
+        One dict per period, oldest first
+    """
+    today = (now or datetime.utcnow()).date()
+    start_day = today - timedelta(days=days - 1)
+
+    points = {}
+    day = start_day
+    while day <= today:
+        points[day] = {
+            "signups": 0,
+            "logins": 0,
+            "submissions": 0,
+            "approvals": 0,
+        }
+        day += timedelta(days=1)
+
+    rows = db.execute(
+        select(DailyStats).where(
+            DailyStats.day >= start_day, DailyStats.day <= today
+        )
+    ).scalars()
+    for row in rows:
+        point = points[_as_date(row.day)]
+        point["logins"] = row.logins
+        point["approvals"] = row.approvals
+        if row.refreshed_at is not None:
+            point["signups"] = row.new_users
+            point["submissions"] = row.new_words
+
+    last_day = db.scalar(select(func.max(DailyStats.day)).where(ROLLED_UP))
+    live_start = start_day
+    if last_day is not None:
+        live_start = max(live_start, _as_date(last_day) + timedelta(days=1))
+    live_end = _start_of(today + timedelta(days=1))
+    for field, column in (
+        ("signups", User.created_at),
+        ("submissions", Word.created_at),
+    ):
+        counts = _counts_by_day(db, column, _start_of(live_start), live_end)
+        for day, count in counts.items():
+            points[day][field] = count
+
+    if interval == "week":
+        weeks = {}
+        for day, point in points.items():
+            week = weeks.setdefault(
+                day - timedelta(days=day.weekday()),
+                dict.fromkeys(point, 0),
+            )
+            for field, value in point.items():
+                week[field] += value
+        points = weeks
+
+    return [{"period": period, **point} for period, point in points.items()]
+
+
+def refresh_daily_stats_once():
+    with SessionLocal() as db:
+        days = refresh_daily_stats(db)
+    if days:
+        logger.info(f"Rolled up daily stats for {days} days")
+
+
+async def run_daily_stats_refresher(interval_seconds: float):
+    """Refresh the daily_stats rollup forever, every interval_seconds."""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_daily_stats_once)
+        except Exception as e:
+            logger.error(f"Daily stats refresh failed: {str(e)}")
+        await asyncio.sleep(interval_seconds)
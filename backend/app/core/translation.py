@@ -1,27 +1,119 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
 from app.core.config import settings
+from app.core.translation_cache import TranslationCache, normalize_source_text
+from app.db.database import SessionLocal
 
 logger = logging.getLogger(__name__)
-GOOGLE_TRANSLATE_API_URL = (
-    "https://translation.googleapis.com/language/translate/v2"
+
+# Upstream responses worth retrying with backoff
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+translation_cache = TranslationCache(
+    session_factory=SessionLocal,
+    max_size=settings.TRANSLATION_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TRANSLATION_CACHE_TTL_SECONDS,
 )
 
+# Upstream requests in flight, keyed by (normalized text, target language),
+# so concurrent requests for the same phrase share a single call
+_in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
 
-async def translate_text(text: str, target_language: str) -> Optional[str]:
+# Long-lived client shared by all translation requests, managed by the
+# application lifespan so connections are kept alive between calls
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=settings.TRANSLATION_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.TRANSLATION_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                settings.TRANSLATION_HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+        ),
+        timeout=httpx.Timeout(settings.TRANSLATION_HTTP_TIMEOUT_SECONDS),
+        transport=transport,
+    )
+
+
+async def start_http_client():
+    global _http_client
+    if _http_client is None:
+        _http_client = create_http_client()
+
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    if _http_client is None:
+        raise RuntimeError("Translation HTTP client is not started")
+    return _http_client
+
+
+async def post_with_retries(url: str, payload: dict) -> httpx.Response:
     """
-    Translate text to the target language using Google Translate API.
+    POST to the translation API, retrying transient failures.
+
+    Transport errors and retryable status codes are retried up to
+    TRANSLATION_MAX_RETRIES times with exponential backoff.
+
+    Raises:
+        httpx.HTTPError: If the last attempt still fails
+    """
+    client = get_http_client()
+    attempts = settings.TRANSLATION_MAX_RETRIES + 1
+    for attempt in range(attempts):
+        last_attempt = attempt == attempts - 1
+        try:
+            response = await client.post(url, json=payload)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.warning(f"Translation request failed: {str(e)}")
+        else:
+            if (
+                response.status_code not in RETRYABLE_STATUS_CODES
+                or last_attempt
+            ):
+                response.raise_for_status()
+                return response
+            logger.warning(
+                f"Translation request returned {response.status_code}"
+            )
+        await asyncio.sleep(
+            settings.TRANSLATION_RETRY_BACKOFF_SECONDS * 2**attempt
+        )
+
+
+async def request_translations(
+    texts: List[str], target_language: str
+) -> List[Optional[str]]:
+    """
+    Translate texts to the target language using Google Translate API.
+
+    All texts are sent upstream in a single multi-`q` request.
 
     Args:
-        text: The text to translate
+        texts: The texts to translate
         target_language: The target language code
             (e.g., 'en' for English, 'el' for Greek)
 
     Returns:
-        The translated text or None if translation fails
+        The translated texts in input order; an item is None if the
+        response did not contain a translation for it
     """
     try:
         api_key = settings.GOOGLE_TRANSLATE_API_KEY
@@ -29,24 +121,20 @@ async def translate_text(text: str, target_language: str) -> Optional[str]:
             logger.error("Google Translate API key is missing")
             raise ValueError("Google Translate API key is not configured")
 
-        logger.info(f"Translating text to {target_language}: {text}")
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{GOOGLE_TRANSLATE_API_URL}?key={api_key}",
-                json={"q": text, "target": target_language, "format": "text"},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get("data", {}).get("translations"):
-                translated_text = data["data"]["translations"][0][
-                    "translatedText"
-                ]
-                logger.info(f"Translation successful: {translated_text}")
-                return translated_text
+        logger.info(f"Translating {len(texts)} text(s) to {target_language}")
+        response = await post_with_retries(
+            f"{settings.GOOGLE_TRANSLATE_API_URL}?key={api_key}",
+            {"q": texts, "target": target_language, "format": "text"},
+        )
+        data = response.json()
 
+        translations = data.get("data", {}).get("translations") or []
+        if not translations:
             logger.error("No translation found in response")
-            return None
+        translated_texts = [
+            translation.get("translatedText") for translation in translations
+        ]
+        return (translated_texts + [None] * len(texts))[: len(texts)]
     except httpx.HTTPError as e:
         logger.error(f"HTTP error during translation: {str(e)}")
         raise
@@ -55,6 +143,106 @@ async def translate_text(text: str, target_language: str) -> Optional[str]:
         raise
 
 
+async def translate_texts(
+    texts: List[str], target_language: str
+) -> List[Optional[str]]:
+    """
+    Translate texts, serving repeats from the cache and coalescing calls.
+
+    Texts missing from the cache are sent upstream in one request. Texts
+    another request is already translating are not sent again; this call
+    waits for that request's result instead, and retries the text itself
+    if that request is cancelled.
+
+    Args:
+        texts: The texts to translate
+        target_language: The target language code
+
+    Returns:
+        The translated texts in input order, None where translation failed
+    """
+    source_texts = [normalize_source_text(text) for text in texts]
+    results: Dict[str, Optional[str]] = await translation_cache.get_many(
+        texts, target_language
+    )
+
+    loop = asyncio.get_running_loop()
+    owned: Dict[str, asyncio.Future] = {}
+    waiting: Dict[str, asyncio.Future] = {}
+    for source_text in dict.fromkeys(source_texts):
+        if source_text in results:
+            continue
+        key = (source_text, target_language)
+        if key in _in_flight:
+            waiting[source_text] = _in_flight[key]
+        else:
+            owned[source_text] = _in_flight[key] = loop.create_future()
+
+    if owned:
+        try:
+            translated_texts = await request_translations(
+                list(owned), target_language
+            )
+        except BaseException as e:
+            for future in owned.values():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Waiters re-raise it; don't log it as unretrieved
+                    future.exception()
+            raise
+        finally:
+            for source_text in owned:
+                _in_flight.pop((source_text, target_language), None)
+
+        for (source_text, future), translated in zip(
+            owned.items(), translated_texts
+        ):
+            future.set_result(translated)
+            results[source_text] = translated
+        await translation_cache.set_many(
+            {
+                source_text: translated
+                for source_text, translated in zip(owned, translated_texts)
+                if translated is not None
+            },
+            target_language,
+        )
+
+    retry = []
+    for source_text, future in waiting.items():
+        try:
+            results[source_text] = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The request that owned the call was cancelled, not this one;
+            # translate the text again rather than failing with it
+            retry.append(source_text)
+    if retry:
+        results.update(
+            zip(retry, await translate_texts(retry, target_language))
+        )
+
+    return [results.get(source_text) for source_text in source_texts]
+
+
+async def translate_text(text: str, target_language: str) -> Optional[str]:
+    """
+    Translate text to the target language, serving repeats from the cache.
+
+    Args:
+        text: The text to translate
+        target_language: The target language code
+            (e.g., 'en' for English, 'el' for Greek)
+
+    Returns:
+        The translated text or None if translation fails
+    """
+    return (await translate_texts([text], target_language))[0]
+
+
 async def translate_to_greek(text: str) -> Optional[str]:
     """Translate text to Greek."""
     return await translate_text(text, "el")
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from anyio import to_thread
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.db.upsert import upsert
+from app.models.translation_cache import TranslationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are purged at most this often by each process
+PURGE_INTERVAL_SECONDS = 60 * 60
+
+
+def normalize_source_text(text: str) -> str:
+    """Collapse whitespace and unicode forms so equal phrases share a key."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TranslationCache:
+    """
+    Two-tier cache of translations keyed by (normalized text, language).
+
+    The in-process LRU tier answers repeated phrases without leaving the
+    event loop. Misses fall through to the persistent tier, a database
+    table shared by every worker, which is read and written on a worker
+    thread with its own short-lived session. Database errors are logged
+    and treated as misses so the cache can never fail a translation.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_size: int,
+        ttl_seconds: float,
+    ):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.memory = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    async def get(self, text: str, target_language: str) -> Optional[str]:
+        return (await self.get_many([text], target_language)).get(
+            normalize_source_text(text)
+        )
+
+    async def get_many(
+        self, texts: List[str], target_language: str
+    ) -> Dict[str, str]:
+        """
+        Look up several texts at once.
+
+        Returns:
+            The cached translations keyed by normalized text; texts that
+            are not cached are left out
+        """
+        found = {}
+        missing = []
+        for source_text in dict.fromkeys(map(normalize_source_text, texts)):
+            translated = self.memory.get((source_text, target_language))
+            if translated is None:
+                missing.append(source_text)
+            else:
+                found[source_text] = translated
+        if not missing:
+            return found
+
+        stored = await to_thread.run_sync(self._read, missing, target_language)
+        with self._lock:
+            self.persistent_hits += len(stored)
+            self.misses += len(missing) - len(stored)
+        for source_text, translated in stored.items():
+            self.memory.set((source_text, target_language), translated)
+        found.update(stored)
+        return found
+
+    async def set(self, text: str, target_language: str, translated: str):
+        await self.set_many({text: translated}, target_language)
+
+    async def set_many(
+        self, translations: Dict[str, str], target_language: str
+    ):
+        """Store translations keyed by their source text."""
+        normalized = {
+            normalize_source_text(text): translated
+            for text, translated in translations.items()
+        }
+        for source_text, translated in normalized.items():
+            self.memory.set((source_text, target_language), translated)
+        await to_thread.run_sync(self._write, normalized, target_language)
+
+    def clear(self):
+        self.memory.clear()
+
+    def stats(self) -> dict:
+        memory = self.memory.stats()
+        with self._lock:
+            persistent_hits = self.persistent_hits
+            misses = self.misses
+        lookups = memory["hits"] + persistent_hits + misses
+        return {
+            "memory_hits": memory["hits"],
+            "persistent_hits": persistent_hits,
+            "misses": misses,
+            "memory_size": memory["size"],
+            "memory_max_size": memory["max_size"],
+            "memory_evictions": memory["evictions"],
+            "hit_ratio": (
+                (memory["hits"] + persistent_hits) / lookups
+                if lookups
+                else 0.0
+            ),
+        }
+
+    def purge_expired(self, db: Session) -> int:
+        """Delete persistent entries older than the TTL."""
+        result = db.execute(
+            delete(TranslationCacheEntry).where(
+                TranslationCacheEntry.created_at < self._expiry_cutoff()
+            )
+        )
+        db.commit()
+        return result.rowcount
+
+    def _expiry_cutoff(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+
+    def _read(
+        self, source_texts: List[str], target_language: str
+    ) -> Dict[str, str]:
+        try:
+            with self.session_factory() as db:
+                rows = db.execute(
+                    select(
+                        TranslationCacheEntry.source_text,
+                        TranslationCacheEntry.translated_text,
+                    ).where(
+                        TranslationCacheEntry.source_text.in_(source_texts),
+                        TranslationCacheEntry.target_language
+                        == target_language,
+                        TranslationCacheEntry.created_at
+                        >= self._expiry_cutoff(),
+                    )
+                )
+                return dict(rows.all())
+        except SQLAlchemyError as e:
+            logger.warning(f"Translation cache read failed: {str(e)}")
+            return {}
+
+    def _write(self, translations: Dict[str, str], target_language: str):
+        now = datetime.utcnow()
+        try:
+            with self.session_factory() as db:
+                upsert(
+                    db,
+                    TranslationCacheEntry.__table__,
+                    [
+                        {
+                            "source_text": source_text,
+                            "target_language": target_language,
+                            "translated_text": translated,
+                            "created_at": now,
+                        }
+                        for source_text, translated in translations.items()
+                    ],
+                    index_elements=["source_text", "target_language"],
+                    update_columns=["translated_text", "created_at"],
+                )
+                db.commit()
+                if self._purge_due():
+                    self.purge_expired(db)
+        except SQLAlchemyError as e:
+            logger.warning(f"Translation cache write failed: {str(e)}")
+
+    def _purge_due(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+                return False
+            self._last_purge = now
+            return True
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from sqlalchemy import event, inspect
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+# Columns needed to authorize a request without reading the users table
+PRINCIPAL_FIELDS = ("id", "email", "role", "is_active", "created_at")
+
+# Principals resolved from token subjects (user emails)
+user_cache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_user(email: str) -> Optional[User]:
+    """
+    Return a detached User built from the cached principal, if any.
+
+    A fresh instance is built for every request so cached state is never
+    shared between sessions or threads.
+    """
+    values = user_cache.get(email)
+    if values is None:
+        return None
+    return User(**values)
+
+
+def cache_user(user: User):
+    user_cache.set(
+        user.email,
+        {field: getattr(user, field) for field in PRINCIPAL_FIELDS},
+    )
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_update(mapper, connection, target):
+    state = inspect(target)
+    if not any(
+        state.attrs[field].history.has_changes()
+        for field in ("email", "role", "is_active")
+    ):
+        return
+    user_cache.delete(target.email)
+    # A changed email leaves the old subject behind
+    for email in state.attrs.email.history.deleted:
+        user_cache.delete(email)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_delete(mapper, connection, target):
+    user_cache.delete(target.email)
@@ -1,13 +1,115 @@
-from sqlalchemy import create_engine
+import sqlite3
+import threading
+import time
+
+from sqlalchemy import DDL, create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+
+class PoolMetrics:
+    """Counters describing how requests wait for pooled connections."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_checkout(self, wait_time: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def record_timeout(self, wait_time: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_time_total_seconds": self.wait_time_total,
+                "wait_time_max_seconds": self.wait_time_max,
+                "wait_time_avg_seconds": (
+                    self.wait_time_total / waits if waits else 0.0
+                ),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout wait times and timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+def get_pool_stats(pool: InstrumentedQueuePool) -> dict:
+    """Snapshot the state and counters of an instrumented pool."""
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # overflow() counts up from -pool_size while the pool fills up
+        "overflow_in_use": max(pool.overflow(), 0),
+        **pool.metrics.snapshot(),
+    }
+
+
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# The trigram search indexes need pg_trgm before the tables are created
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite only enforces foreign keys, ON DELETE CASCADE included, when
+    # every connection asks for it
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 def get_db():
     db = SessionLocal()
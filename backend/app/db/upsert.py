@@ -0,0 +1,108 @@
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def _insert_for(db: Session):
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(f"upsert is not supported on {dialect_name}")
+
+
+def upsert(
+    db: Session,
+    table: Table,
+    rows: List[dict],
+    index_elements: Iterable[str],
+    update_columns: Iterable[str],
+):
+    """
+    Insert rows, updating the given columns of rows that already exist.
+
+    Args:
+        db: The session to execute the statement with
+        table: The table to write to
+        rows: The rows to insert
+        index_elements: The columns of the unique constraint to resolve on
+        update_columns: The columns to overwrite on conflict
+    """
+    if not rows:
+        return
+    stmt = _insert_for(db)(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={column: stmt.excluded[column] for column in update_columns},
+    )
+    db.execute(stmt, rows)
+
+
+def insert_missing(
+    db: Session,
+    table: Table,
+    rows: List[dict],
+    index_elements: Iterable[str],
+):
+    """
+    Insert rows, leaving rows that already exist untouched.
+
+    Args:
+        db: The session to execute the statement with
+        table: The table to write to
+        rows: The rows to insert
+        index_elements: The columns of the unique constraint to resolve on
+    """
+    if not rows:
+        return
+    stmt = _insert_for(db)(table).on_conflict_do_nothing(
+        index_elements=list(index_elements)
+    )
+    db.execute(stmt, rows)
+
+
+def increment(
+    db: Session,
+    table: Table,
+    key: dict,
+    counts: dict,
+    values: Optional[dict] = None,
+    returning: Iterable[str] = (),
+):
+    """
+    Add to counter columns of a row, creating the row if it is missing.
+
+    The addition happens in the database, so concurrent increments of the
+    same row never overwrite each other.
+
+    Args:
+        db: The session to execute the statement with
+        table: The table to write to
+        key: The values of the unique constraint identifying the row
+        counts: The amount to add to each counter column
+        values: Other columns to set, on insert and on update alike
+        returning: Columns to read back from the written row
+
+    Returns:
+        The returned columns of the row, when any were asked for
+    """
+    values = values or {}
+    stmt = _insert_for(db)(table).values(**key, **counts, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={
+            **{
+                column: table.c[column] + stmt.excluded[column]
+                for column in counts
+            },
+            **{column: stmt.excluded[column] for column in values},
+        },
+    )
+    if returning:
+        return db.execute(
+            stmt.returning(*(table.c[column] for column in returning))
+        ).one()
+    db.execute(stmt)
@@ -1,16 +1,45 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import admin, auth, translation, words
+from app.api import admin, auth, reviews, translation, words
 from app.core.config import settings
+from app.core.stats import run_daily_stats_refresher
+from app.core.translation import close_http_client, start_http_client
 from app.db.database import Base, engine
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Route handlers doing blocking database I/O are plain `def` functions,
+    # which FastAPI runs on this thread pool to keep the event loop free
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREADPOOL_SIZE
+
+    await start_http_client()
+    stats_refresher = None
+    if settings.DAILY_STATS_REFRESH_SECONDS > 0:
+        stats_refresher = asyncio.create_task(
+            run_daily_stats_refresher(settings.DAILY_STATS_REFRESH_SECONDS)
+        )
+    try:
+        yield
+    finally:
+        if stats_refresher:
+            stats_refresher.cancel()
+        await close_http_client()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -33,6 +62,9 @@ app.include_router(
 app.include_router(
     words.router, prefix=f"{settings.API_V1_STR}/words", tags=["words"]
 )
+app.include_router(
+    reviews.router, prefix=f"{settings.API_V1_STR}/reviews", tags=["reviews"]
+)
 app.include_router(
     translation.router,
     prefix=f"{settings.API_V1_STR}/translation",
@@ -1,5 +1,21 @@
+from app.models.daily_stats import DailyStats
+from app.models.deleted_word import DeletedWord
+from app.models.dictionary_version import DictionaryVersion
 from app.models.meaning import Meaning
+from app.models.review_card import ReviewCard
+from app.models.translation_cache import TranslationCacheEntry
 from app.models.user import User
 from app.models.word import Gender, Word, WordType
 
-__all__ = ["User", "Word", "WordType", "Gender", "Meaning"]
+__all__ = [
+    "User",
+    "Word",
+    "WordType",
+    "Gender",
+    "Meaning",
+    "TranslationCacheEntry",
+    "DailyStats",
+    "DictionaryVersion",
+    "ReviewCard",
+    "DeletedWord",
+]
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Date, DateTime, Integer
+
+from app.db.database import Base
+
+
+class DailyStats(Base):
+    """
+    Per-day (UTC) activity counters.
+
+    new_users, new_words and the totals are rolled up from the users and
+    words tables once a day has closed, and refreshed_at is only set by
+    that rollup. logins and approvals have no history to roll up from, so
+    they are incremented as they happen.
+    """
+
+    __tablename__ = "daily_stats"
+
+    day = Column(Date, primary_key=True)
+    new_users = Column(Integer, nullable=False, default=0)
+    new_words = Column(Integer, nullable=False, default=0)
+    # Running totals as of the end of the day
+    total_users = Column(Integer, nullable=False, default=0)
+    total_words = Column(Integer, nullable=False, default=0)
+    logins = Column(Integer, nullable=False, default=0, server_default="0")
+    approvals = Column(Integer, nullable=False, default=0, server_default="0")
+    refreshed_at = Column(DateTime, nullable=True)
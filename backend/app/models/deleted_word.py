@@ -0,0 +1,16 @@
+from sqlalchemy import Column, DateTime, Integer
+
+from app.db.database import Base
+
+
+class DeletedWord(Base):
+    """
+    Tombstone of a deleted word, kept so sync clients learn about the
+    deletion. Meanings need none: a changed meaning resyncs its word.
+    """
+
+    __tablename__ = "deleted_words"
+
+    word_id = Column(Integer, primary_key=True)
+    sync_version = Column(Integer, nullable=False, index=True)
+    deleted_at = Column(DateTime, nullable=False)
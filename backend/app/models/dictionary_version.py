@@ -0,0 +1,183 @@
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import Column, DateTime, Integer, event, inspect, update
+from sqlalchemy.orm import Session
+
+from app.db.database import Base
+from app.db.upsert import increment, upsert
+from app.models.deleted_word import DeletedWord
+from app.models.meaning import Meaning
+from app.models.word import ApprovalStatus, Word
+
+_CHANGED = "dictionary_changed"
+_APPROVED_CHANGED = "approved_dictionary_changed"
+_CHANGED_WORDS = "dictionary_changed_words"
+_DELETED_WORDS = "dictionary_deleted_words"
+# Ids per statement when stamping changed words
+_STAMP_BATCH_SIZE = 1000
+
+
+class DictionaryVersion(Base):
+    """
+    Single-row counters bumped by every transaction that changes words or
+    meanings, used to validate cached word responses and as the sync
+    token of the change feed.
+
+    version counts every change, approved_version only changes that can
+    be seen by users who are not shown pending words. Each committed
+    change stamps the words it touched, or their tombstones, with the new
+    version. The counter row stays locked from the bump until the commit,
+    so versions become visible in increasing order.
+    """
+
+    __tablename__ = "dictionary_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=True)
+    approved_version = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+
+class DictionaryState(NamedTuple):
+    version: int
+    updated_at: Optional[datetime]
+    approved_version: int
+
+
+def get_dictionary_version(db: Session) -> DictionaryState:
+    """Return the current version counters of the dictionary."""
+    row = db.execute(
+        DictionaryVersion.__table__.select().with_only_columns(
+            DictionaryVersion.version,
+            DictionaryVersion.updated_at,
+            DictionaryVersion.approved_version,
+        )
+    ).first()
+    return DictionaryState(*row) if row else DictionaryState(0, None, 0)
+
+
+def mark_dictionary_changed(
+    session: Session,
+    approved: bool = True,
+    word_ids: Iterable[int] = (),
+    deleted_word_ids: Iterable[int] = (),
+):
+    """
+    Bump the dictionary version when the session's transaction commits.
+
+    Changes made through the unit of work are tracked automatically; code
+    writing words or meanings with bulk INSERT, UPDATE or DELETE
+    statements, which bypass the flush, has to call this itself.
+
+    Args:
+        session: The session making the change
+        approved: Whether the change can affect approved words
+        word_ids: The words changed, or whose meanings changed
+        deleted_word_ids: The words deleted
+    """
+    session.info[_CHANGED] = True
+    if approved:
+        session.info[_APPROVED_CHANGED] = True
+    session.info.setdefault(_CHANGED_WORDS, set()).update(word_ids)
+    session.info.setdefault(_DELETED_WORDS, set()).update(deleted_word_ids)
+
+
+def _changed_word_ids(session: Session, objs) -> tuple:
+    changed, deleted = set(), set()
+    for obj in objs:
+        if isinstance(obj, Word):
+            if obj in session.deleted:
+                deleted.add(obj.id)
+            else:
+                changed.add(obj.id)
+        elif obj.word_id is not None:
+            changed.add(obj.word_id)
+    return changed, deleted
+
+
+def _affects_approved(session: Session, obj) -> bool:
+    if isinstance(obj, Meaning):
+        # Judge a meaning by its word when the session holds it; unknown
+        # words are assumed to be approved
+        word = obj.word if "word" in obj.__dict__ else None
+        if word is None and obj.word_id is not None:
+            word = session.identity_map.get(
+                inspect(Word).identity_key_from_primary_key([obj.word_id])
+            )
+        if word is None:
+            return True
+        obj = word
+
+    history = inspect(obj).attrs.approval_status.history
+    statuses = set(history.added) | set(history.unchanged)
+    statuses |= set(history.deleted)
+    return not statuses or ApprovalStatus.APPROVED in statuses
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_changes(session, flush_context):
+    changed = [
+        obj
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, (Word, Meaning))
+    ]
+    if changed:
+        word_ids, deleted_word_ids = _changed_word_ids(session, changed)
+        mark_dictionary_changed(
+            session,
+            approved=any(_affects_approved(session, obj) for obj in changed),
+            word_ids=word_ids,
+            deleted_word_ids=deleted_word_ids,
+        )
+
+
+def _stamp_changes(session: Session, version: int, now: datetime):
+    deleted = session.info.pop(_DELETED_WORDS, set())
+    changed = sorted(session.info.pop(_CHANGED_WORDS, set()) - deleted)
+    for start in range(0, len(changed), _STAMP_BATCH_SIZE):
+        session.execute(
+            update(Word.__table__)
+            .where(Word.id.in_(changed[start : start + _STAMP_BATCH_SIZE]))
+            .values(sync_version=version, updated_at=now)
+        )
+    upsert(
+        session,
+        DeletedWord.__table__,
+        [
+            {"word_id": word_id, "sync_version": version, "deleted_at": now}
+            for word_id in sorted(deleted)
+        ],
+        index_elements=["word_id"],
+        update_columns=["sync_version", "deleted_at"],
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_dictionary_version(session):
+    session.flush()
+    if session.info.pop(_CHANGED, False):
+        counts = {"version": 1}
+        if session.info.pop(_APPROVED_CHANGED, False):
+            counts["approved_version"] = 1
+        now = datetime.utcnow()
+        (version,) = increment(
+            session,
+            DictionaryVersion.__table__,
+            {"id": 1},
+            counts,
+            values={"updated_at": now},
+            returning=["version"],
+        )
+        _stamp_changes(session, version, now)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_changes(session, previous_transaction):
+    session.info.pop(_CHANGED, None)
+    session.info.pop(_APPROVED_CHANGED, None)
+    session.info.pop(_CHANGED_WORDS, None)
+    session.info.pop(_DELETED_WORDS, None)
@@ -1,4 +1,14 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -10,5 +20,19 @@ class Meaning(Base):
     id = Column(Integer, primary_key=True, index=True)
     english_meaning = Column(String)
     is_primary = Column(Boolean, default=False)
-    word_id = Column(Integer, ForeignKey("words.id"))
+    word_id = Column(
+        Integer, ForeignKey("words.id", ondelete="CASCADE"), index=True
+    )
     word = relationship("Word", back_populates="meanings")
+    updated_at = Column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_meanings_english_meaning_trgm",
+            "english_meaning",
+            postgresql_using="gin",
+            postgresql_ops={"english_meaning": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+
+from app.db.database import Base
+
+
+class ReviewCard(Base):
+    """
+    A user's spaced repetition state for one word.
+
+    The scheduling columns follow SM-2: a card is shown again on due_at,
+    interval_days after its last successful review.
+    """
+
+    __tablename__ = "review_cards"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    word_id = Column(
+        Integer, ForeignKey("words.id", ondelete="CASCADE"), nullable=False
+    )
+    repetitions = Column(Integer, nullable=False, default=0)
+    interval_days = Column(Integer, nullable=False, default=0)
+    ease_factor = Column(Float, nullable=False, default=2.5)
+    lapses = Column(Integer, nullable=False, default=0)
+    due_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_reviewed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "word_id", name="uq_review_cards_user_id_word_id"
+        ),
+        # A user's queue is a range scan of this index up to now
+        Index("ix_review_cards_user_id_due_at", "user_id", "due_at"),
+    )
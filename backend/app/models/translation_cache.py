@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+
+from app.db.database import Base
+
+
+class TranslationCacheEntry(Base):
+    __tablename__ = "translation_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_text = Column(String, nullable=False)
+    target_language = Column(String, nullable=False)
+    translated_text = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "source_text",
+            "target_language",
+            name="uq_translation_cache_source_text_target_language",
+        ),
+    )
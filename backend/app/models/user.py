@@ -13,5 +13,7 @@ class User(Base):
     hashed_password = Column(String)
     is_active = Column(Boolean, default=True)
     role = Column(String, default="user")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    last_login = Column(DateTime, nullable=True)
+    # Serve the admin listing of recent users and the signup and activity
+    # counts of the dashboard
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_login = Column(DateTime, nullable=True, index=True)
@@ -1,9 +1,18 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Identity, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.orm import relationship, validates
 
+from app.core.greek import normalize_greek
 from app.db.database import Base
 
 
@@ -36,13 +45,64 @@ class Word(Base):
 
     id = Column(Integer, Identity(always=True), primary_key=True, index=True)
     greek_word = Column(String, index=True)
-    word_type = Column(String)
-    gender = Column(String, nullable=True)
+    # Accent- and case-insensitive search key, kept in sync with greek_word
+    greek_word_normalized = Column(String, nullable=True)
+    word_type = Column(String, index=True)
+    gender = Column(String, nullable=True, index=True)
     notes = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Set when the word or one of its meanings changes, to the dictionary
+    # version of the transaction that changed it
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    sync_version = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     approval_status = Column(String, default=ApprovalStatus.PENDING)
+    # The database deletes the meanings of a deleted word, so the session
+    # does not have to load them first
     meanings = relationship(
-        "Meaning", back_populates="word", cascade="all, delete-orphan"
+        "Meaning",
+        back_populates="word",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    created_by = Column(
+        Integer, ForeignKey("users.id"), nullable=True, index=True
     )
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     submitter = relationship("User", backref="submitted_words")
+
+    __table_args__ = (
+        # Serves the approval_status filter of every listing and the
+        # created_at ordered moderation queue
+        Index(
+            "ix_words_approval_status_created_at",
+            "approval_status",
+            "created_at",
+        ),
+        # Keyset order of the incremental sync feed
+        Index("ix_words_sync_version_id", "sync_version", "id"),
+        # text_pattern_ops lets prefix LIKE lookups seek the btree
+        Index(
+            "ix_words_greek_word_normalized",
+            "greek_word_normalized",
+            postgresql_ops={"greek_word_normalized": "text_pattern_ops"},
+        ),
+        # Trigram indexes serve the substring search in read_words
+        Index(
+            "ix_words_greek_word_normalized_trgm",
+            "greek_word_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"greek_word_normalized": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_words_notes_trgm",
+            "notes",
+            postgresql_using="gin",
+            postgresql_ops={"notes": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    @validates("greek_word")
+    def _normalize_greek_word(self, key, value):
+        self.greek_word_normalized = normalize_greek(value)
+        return value
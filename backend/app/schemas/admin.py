@@ -1,3 +1,6 @@
+from datetime import date
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel
 
 
@@ -5,8 +8,21 @@ class DashboardStats(BaseModel):
     total_users: int
     active_users: int
     total_content: int
-    user_growth: int
-    content_growth: int
+    user_growth: float
+    content_growth: float
+
+
+class ActivityPoint(BaseModel):
+    period: date
+    signups: int
+    logins: int
+    submissions: int
+    approvals: int
+
+
+class ActivitySeries(BaseModel):
+    interval: Literal["day", "week"]
+    points: List[ActivityPoint]
 
 
 class RecentUser(BaseModel):
@@ -23,3 +39,45 @@ class RecentContent(BaseModel):
     type: str
     created: str
     status: str
+
+
+class PoolStats(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow_in_use: int
+    checkouts: int
+    timeouts: int
+    wait_time_total_seconds: float
+    wait_time_max_seconds: float
+    wait_time_avg_seconds: float
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    hit_ratio: float
+
+
+class ResponseCacheStats(BaseModel):
+    backend: str
+    hits: int
+    misses: int
+    hit_ratio: float
+    size: Optional[int]
+    max_size: Optional[int]
+
+
+class PasswordHashingStats(BaseModel):
+    max_workers: int
+    max_pending: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    wait_time_avg_seconds: float
+    run_time_avg_seconds: float
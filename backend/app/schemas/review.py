@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.word import Flashcard
+
+
+class DueCard(Flashcard):
+    due_at: datetime
+    interval_days: int
+    repetitions: int
+
+
+class ReviewSubmission(BaseModel):
+    word_id: int
+    grade: int = Field(..., ge=0, le=5)
+    # When the card was answered, for reviews queued while offline
+    reviewed_at: Optional[datetime] = None
+
+
+class ReviewBatch(BaseModel):
+    reviews: List[ReviewSubmission] = Field(..., min_length=1, max_length=500)
+
+
+class ReviewOutcome(BaseModel):
+    word_id: int
+    status: Literal["reviewed", "not_found"]
+    due_at: Optional[datetime] = None
+    interval_days: Optional[int] = None
+
+
+class ReviewBatchResult(BaseModel):
+    reviewed: int
+    results: List[ReviewOutcome]
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models.word import ApprovalStatus, Gender, WordType
 from app.schemas.user import UserOut
@@ -16,6 +16,11 @@ class MeaningCreate(MeaningBase):
     pass
 
 
+class MeaningUpdate(MeaningBase):
+    # Existing meanings are matched by id; meanings without one are added
+    id: Optional[int] = None
+
+
 class Meaning(MeaningBase):
     id: int
     word_id: int
@@ -34,9 +39,29 @@ class WordCreate(WordBase):
     meanings: List[MeaningCreate]
 
 
+class WordUpdate(WordBase):
+    meanings: List[MeaningUpdate]
+
+
+class WordPatch(BaseModel):
+    greek_word: Optional[str] = None
+    word_type: Optional[WordType] = None
+    gender: Optional[Gender] = None
+    notes: Optional[str] = None
+    meanings: Optional[List[MeaningUpdate]] = None
+
+    @model_validator(mode="after")
+    def check_required(self):
+        for field in ("greek_word", "word_type", "meanings"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
 class Word(WordBase):
     id: int
     created_at: Optional[datetime]
+    updated_at: Optional[datetime] = None
     created_by: Optional[int]
     submitter: Optional[UserOut]
     meanings: List[Meaning]
@@ -48,3 +73,61 @@ class Word(WordBase):
         if data.get("created_at"):
             data["created_at"] = data["created_at"].isoformat()
         return data
+
+
+class Flashcard(BaseModel):
+    id: int
+    greek_word: str
+    word_type: WordType
+    gender: Optional[Gender] = None
+    notes: Optional[str] = None
+    meaning: Optional[str] = None
+
+
+class WordChanges(BaseModel):
+    words: List[Word]
+    # Ids of words deleted, or no longer visible to the caller
+    deleted: List[int]
+    next_token: str
+    has_more: bool
+
+
+class WordImportError(BaseModel):
+    line: int
+    error: str
+
+
+class WordImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[WordImportError]
+
+
+class WordModerationFilter(BaseModel):
+    search: Optional[str] = None
+    match: Literal["contains", "prefix", "exact"] = "contains"
+    word_type: Optional[str] = None
+    gender: Optional[str] = None
+    created_by: Optional[int] = None
+
+
+class WordBulkModerationRequest(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    filter: Optional[WordModerationFilter] = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide either ids or filter")
+        return self
+
+
+class WordModerationOutcome(BaseModel):
+    id: int
+    status: Literal["updated", "not_found"]
+
+
+class WordBulkModerationResult(BaseModel):
+    approval_status: ApprovalStatus
+    updated: int
+    results: List[WordModerationOutcome]
@@ -0,0 +1,50 @@
+"""add trigram search indexes
+
+Revision ID: 25942cd1d1fb
+Revises:
+Create Date: 2026-10-18 09:12:44.118204
+
+The tables themselves are created by ``Base.metadata.create_all`` on
+startup, so this first revision only adds what an existing database lacks.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "25942cd1d1fb"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = [
+    ("ix_words_greek_word_trgm", "words", "greek_word"),
+    ("ix_words_notes_trgm", "words", "notes"),
+    ("ix_meanings_english_meaning_trgm", "meanings", "english_meaning"),
+]
+
+
+def upgrade() -> None:
+    # Trigram indexes are PostgreSQL only; other databases keep scanning
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for name, table, _ in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,89 @@
+"""add normalized greek word
+
+Revision ID: 28549c19bc8b
+Revises: 25942cd1d1fb
+Create Date: 2026-10-18 10:03:27.551870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.greek import normalize_greek
+
+# revision identifiers, used by Alembic.
+revision: str = "28549c19bc8b"
+down_revision: Union[str, None] = "25942cd1d1fb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+words = sa.table(
+    "words",
+    sa.column("id", sa.Integer),
+    sa.column("greek_word", sa.String),
+    sa.column("greek_word_normalized", sa.String),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.add_column(
+        "words", sa.Column("greek_word_normalized", sa.String(), nullable=True)
+    )
+
+    # Backfill the search key in batches
+    rows = bind.execute(sa.select(words.c.id, words.c.greek_word)).all()
+    update = (
+        words.update()
+        .where(words.c.id == sa.bindparam("word_id"))
+        .values(greek_word_normalized=sa.bindparam("normalized"))
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        bind.execute(
+            update,
+            [
+                {"word_id": id_, "normalized": normalize_greek(greek_word)}
+                for id_, greek_word in rows[start : start + BATCH_SIZE]
+            ],
+        )
+
+    op.create_index(
+        "ix_words_greek_word_normalized",
+        "words",
+        ["greek_word_normalized"],
+        postgresql_ops={"greek_word_normalized": "text_pattern_ops"},
+    )
+
+    if bind.dialect.name == "postgresql":
+        # Substring search now runs against the normalized key
+        op.drop_index(
+            "ix_words_greek_word_trgm", table_name="words", if_exists=True
+        )
+        op.create_index(
+            "ix_words_greek_word_normalized_trgm",
+            "words",
+            ["greek_word_normalized"],
+            postgresql_using="gin",
+            postgresql_ops={"greek_word_normalized": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index(
+            "ix_words_greek_word_normalized_trgm", table_name="words"
+        )
+        op.create_index(
+            "ix_words_greek_word_trgm",
+            "words",
+            ["greek_word"],
+            postgresql_using="gin",
+            postgresql_ops={"greek_word": "gin_trgm_ops"},
+        )
+
+    op.drop_index("ix_words_greek_word_normalized", table_name="words")
+    op.drop_column("words", "greek_word_normalized")
@@ -0,0 +1,39 @@
+"""add daily stats activity counters
+
+Revision ID: 2fe40431a78e
+Revises: e3ccd047753c
+Create Date: 2026-10-18 15:26:48.117402
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2fe40431a78e"
+down_revision: Union[str, None] = "e3ccd047753c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A table created on startup already has the counters
+    existing = {
+        column["name"]
+        for column in sa.inspect(op.get_bind()).get_columns("daily_stats")
+    }
+    for name in ("logins", "approvals"):
+        if name not in existing:
+            op.add_column(
+                "daily_stats",
+                sa.Column(
+                    name, sa.Integer(), server_default="0", nullable=False
+                ),
+            )
+
+
+def downgrade() -> None:
+    op.drop_column("daily_stats", "approvals")
+    op.drop_column("daily_stats", "logins")
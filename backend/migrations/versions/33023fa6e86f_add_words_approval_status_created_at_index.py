@@ -0,0 +1,30 @@
+"""add words approval_status created_at index
+
+Revision ID: 33023fa6e86f
+Revises: 76f3bfc4507b
+Create Date: 2026-10-18 14:02:37.418265
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "33023fa6e86f"
+down_revision: Union[str, None] = "76f3bfc4507b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_words_approval_status_created_at",
+        "words",
+        ["approval_status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_words_approval_status_created_at", table_name="words")
@@ -0,0 +1,56 @@
+"""add review cards
+
+Revision ID: 334698183cf3
+Revises: f9ae201b4e29
+Create Date: 2026-10-18 18:21:40.512093
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "334698183cf3"
+down_revision: Union[str, None] = "f9ae201b4e29"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nothing to do if the application created the table, with its
+    # indexes, on startup
+    if sa.inspect(op.get_bind()).has_table("review_cards"):
+        return
+
+    op.create_table(
+        "review_cards",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("word_id", sa.Integer(), nullable=False),
+        sa.Column("repetitions", sa.Integer(), nullable=False),
+        sa.Column("interval_days", sa.Integer(), nullable=False),
+        sa.Column("ease_factor", sa.Float(), nullable=False),
+        sa.Column("lapses", sa.Integer(), nullable=False),
+        sa.Column("due_at", sa.DateTime(), nullable=False),
+        sa.Column("last_reviewed_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["word_id"], ["words.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "word_id", name="uq_review_cards_user_id_word_id"
+        ),
+    )
+    op.create_index(
+        "ix_review_cards_user_id_due_at",
+        "review_cards",
+        ["user_id", "due_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_cards_user_id_due_at", table_name="review_cards")
+    op.drop_table("review_cards")
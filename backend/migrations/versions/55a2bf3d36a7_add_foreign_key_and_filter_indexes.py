@@ -0,0 +1,39 @@
+"""add foreign key and filter indexes
+
+Revision ID: 55a2bf3d36a7
+Revises: b1a094ef9dbf
+Create Date: 2026-10-18 22:14:08.930257
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "55a2bf3d36a7"
+down_revision: Union[str, None] = "b1a094ef9dbf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("meanings", "word_id"),
+    ("words", "created_by"),
+    ("words", "word_type"),
+    ("words", "gender"),
+    ("words", "created_at"),
+    ("users", "created_at"),
+    ("users", "last_login"),
+]
+
+
+def upgrade() -> None:
+    for table, column in INDEXES:
+        op.create_index(
+            op.f(f"ix_{table}_{column}"), table, [column], unique=False
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(INDEXES):
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
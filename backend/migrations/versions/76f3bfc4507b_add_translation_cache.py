@@ -0,0 +1,57 @@
+"""add translation cache
+
+Revision ID: 76f3bfc4507b
+Revises: 28549c19bc8b
+Create Date: 2026-10-18 11:41:05.320117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "76f3bfc4507b"
+down_revision: Union[str, None] = "28549c19bc8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The application creates missing tables on startup, so the table and
+    # its indexes may already be current
+    if sa.inspect(op.get_bind()).has_table("translation_cache"):
+        return
+
+    op.create_table(
+        "translation_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source_text", sa.String(), nullable=False),
+        sa.Column("target_language", sa.String(), nullable=False),
+        sa.Column("translated_text", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "source_text",
+            "target_language",
+            name="uq_translation_cache_source_text_target_language",
+        ),
+    )
+    op.create_index(
+        "ix_translation_cache_id", "translation_cache", ["id"], unique=False
+    )
+    op.create_index(
+        "ix_translation_cache_created_at",
+        "translation_cache",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_translation_cache_created_at", table_name="translation_cache"
+    )
+    op.drop_index("ix_translation_cache_id", table_name="translation_cache")
+    op.drop_table("translation_cache")
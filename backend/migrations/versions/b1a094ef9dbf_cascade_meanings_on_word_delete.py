@@ -0,0 +1,44 @@
+"""cascade meanings on word delete
+
+Revision ID: b1a094ef9dbf
+Revises: cbb484181853
+Create Date: 2026-10-18 21:05:37.664310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b1a094ef9dbf"
+down_revision: Union[str, None] = "cbb484181853"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT = "meanings_word_id_fkey"
+
+
+def upgrade() -> None:
+    # SQLite cannot alter constraints in place; it only backs development
+    # and test databases, which create_all builds with the cascade
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_constraint(CONSTRAINT, "meanings", type_="foreignkey")
+    op.create_foreign_key(
+        CONSTRAINT,
+        "meanings",
+        "words",
+        ["word_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_constraint(CONSTRAINT, "meanings", type_="foreignkey")
+    op.create_foreign_key(CONSTRAINT, "meanings", "words", ["word_id"], ["id"])
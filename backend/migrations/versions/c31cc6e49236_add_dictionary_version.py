@@ -0,0 +1,36 @@
+"""add dictionary version
+
+Revision ID: c31cc6e49236
+Revises: 2fe40431a78e
+Create Date: 2026-10-18 16:05:51.264730
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c31cc6e49236"
+down_revision: Union[str, None] = "2fe40431a78e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_all on startup may have built it already
+    if sa.inspect(op.get_bind()).has_table("dictionary_version"):
+        return
+
+    op.create_table(
+        "dictionary_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("dictionary_version")
@@ -0,0 +1,71 @@
+"""add word sync columns
+
+Revision ID: cbb484181853
+Revises: 334698183cf3
+Create Date: 2026-10-18 19:47:12.208615
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cbb484181853"
+down_revision: Union[str, None] = "334698183cf3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "words", sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+    op.add_column(
+        "words",
+        sa.Column(
+            "sync_version", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.add_column(
+        "meanings", sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+    # Existing words count as changed by the current version, so the first
+    # sync of every client picks them up
+    op.execute(
+        "UPDATE words SET updated_at = created_at, sync_version = "
+        "COALESCE((SELECT version FROM dictionary_version WHERE id = 1), 0)"
+    )
+    op.create_index(
+        "ix_words_sync_version_id",
+        "words",
+        ["sync_version", "id"],
+        unique=False,
+    )
+    # The application may have created the tombstones on startup
+    if not sa.inspect(op.get_bind()).has_table("deleted_words"):
+        op.create_table(
+            "deleted_words",
+            sa.Column("word_id", sa.Integer(), nullable=False),
+            sa.Column("sync_version", sa.Integer(), nullable=False),
+            sa.Column("deleted_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("word_id"),
+        )
+        op.create_index(
+            op.f("ix_deleted_words_sync_version"),
+            "deleted_words",
+            ["sync_version"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_deleted_words_sync_version"), table_name="deleted_words"
+    )
+    op.drop_table("deleted_words")
+    op.drop_index("ix_words_sync_version_id", table_name="words")
+    op.drop_column("meanings", "updated_at")
+    op.drop_column("words", "sync_version")
+    op.drop_column("words", "updated_at")
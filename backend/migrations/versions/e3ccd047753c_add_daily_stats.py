@@ -0,0 +1,39 @@
+"""add daily stats
+
+Revision ID: e3ccd047753c
+Revises: 33023fa6e86f
+Create Date: 2026-10-18 14:47:12.903518
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3ccd047753c"
+down_revision: Union[str, None] = "33023fa6e86f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Left alone when the application already created it on startup
+    if sa.inspect(op.get_bind()).has_table("daily_stats"):
+        return
+
+    op.create_table(
+        "daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("new_users", sa.Integer(), nullable=False),
+        sa.Column("new_words", sa.Integer(), nullable=False),
+        sa.Column("total_users", sa.Integer(), nullable=False),
+        sa.Column("total_words", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_stats")
@@ -0,0 +1,39 @@
+"""add approved dictionary version
+
+Revision ID: f9ae201b4e29
+Revises: c31cc6e49236
+Create Date: 2026-10-18 16:52:09.731846
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f9ae201b4e29"
+down_revision: Union[str, None] = "c31cc6e49236"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Present already when the table was created on startup
+    columns = sa.inspect(op.get_bind()).get_columns("dictionary_version")
+    if any(column["name"] == "approved_version" for column in columns):
+        return
+
+    op.add_column(
+        "dictionary_version",
+        sa.Column(
+            "approved_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("dictionary_version", "approved_version")
@@ -1,3 +1,5 @@
+import json
+
 from fastapi import status
 
 from app.models.user import User
@@ -86,3 +88,126 @@ def test_get_recent_content(admin_client, client, db_session):
     # Test as regular user (should fail)
     response = client.get("/api/v1/admin/content")
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_db_pool_metrics(admin_client, client):
+    response = admin_client.get("/api/v1/admin/metrics/db-pool")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert "checkouts" in data
+    assert "overflow_in_use" in data
+    assert "wait_time_avg_seconds" in data
+
+    # Test as regular user (should fail)
+    response = client.get("/api/v1/admin/metrics/db-pool")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_password_hashing_metrics(admin_client, client):
+    response = admin_client.get("/api/v1/admin/metrics/password-hashing")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["max_workers"] >= 1
+    assert "queued" in data
+    assert "rejected" in data
+
+    # Test as regular user (should fail)
+    response = client.get("/api/v1/admin/metrics/password-hashing")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_analytics(admin_client, client, db_session):
+    client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "series@example.com",
+            "password": "testpassword123",
+            "role": "user",
+        },
+    )
+    for _ in range(2):
+        client.post(
+            "/api/v1/auth/token",
+            data={
+                "username": "series@example.com",
+                "password": "testpassword123",
+            },
+        )
+    words = [
+        Word(
+            greek_word=f"word{i}",
+            word_type="noun",
+            approval_status=ApprovalStatus.PENDING,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(words)
+    db_session.commit()
+    word_ids = [word.id for word in words]
+    admin_client.post(f"/api/v1/words/{word_ids[0]}/approve")
+    admin_client.post("/api/v1/words/bulk/approve", json={"ids": word_ids[1:]})
+
+    response = admin_client.get("/api/v1/admin/analytics?days=7")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["interval"] == "day"
+    assert len(data["points"]) == 7
+    today = data["points"][-1]
+    assert today["logins"] == 2
+    assert today["approvals"] == 3
+    assert today["submissions"] == 3
+    # The test user and admin fixtures plus the registered user
+    assert today["signups"] == 3
+
+    response = admin_client.get("/api/v1/admin/analytics?interval=week")
+    assert response.json()["points"][-1]["approvals"] == 3
+
+    # Test as regular user (should fail)
+    response = client.get("/api/v1/admin/analytics")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_edits_and_imports_count_as_approvals(admin_client, add_words):
+    pending_id, approved_id = add_words(
+        "εκκρεμής", "εγκεκριμένη", approval_status=ApprovalStatus.PENDING
+    )
+    admin_client.patch(f"/api/v1/words/{pending_id}", json={"notes": "ok"})
+    admin_client.post(f"/api/v1/words/{approved_id}/approve")
+    # Editing an approved word does not approve it again
+    admin_client.patch(f"/api/v1/words/{approved_id}", json={"notes": "ok"})
+    admin_client.post(
+        "/api/v1/words/import?format=jsonl",
+        files={
+            "file": (
+                "upload",
+                "\n".join(
+                    json.dumps(
+                        {
+                            "greek_word": greek_word,
+                            "word_type": "noun",
+                            "meanings": [],
+                        }
+                    )
+                    for greek_word in ("ένα", "δύο")
+                ).encode(),
+            )
+        },
+    )
+
+    response = admin_client.get("/api/v1/admin/analytics?days=1")
+    assert response.json()["points"][-1]["approvals"] == 4
+
+
+def test_repeated_approvals_count_once(admin_client, add_words):
+    first_id, second_id = add_words(
+        "πρώτη", "δεύτερη", approval_status=ApprovalStatus.PENDING
+    )
+    for _ in range(3):
+        admin_client.post(f"/api/v1/words/{first_id}/approve")
+    for _ in range(2):
+        admin_client.post(
+            "/api/v1/words/bulk/approve", json={"ids": [first_id, second_id]}
+        )
+
+    response = admin_client.get("/api/v1/admin/analytics?days=1")
+    assert response.json()["points"][-1]["approvals"] == 2
@@ -1,5 +1,10 @@
+from unittest.mock import patch
+
 from fastapi import status
+from passlib.context import CryptContext
 
+from app.core.security import PasswordHasherBusyError, pwd_context
+from app.core.user_cache import user_cache
 from app.models.user import User
 
 
@@ -106,3 +111,63 @@ def test_get_current_user(client, db_session):
     assert data["email"] == user_data["email"]
     assert data["role"] == user_data["role"]
     assert "id" in data
+
+
+def test_current_user_is_cached(client, test_user, statements):
+    before = user_cache.stats()
+    response = client.get("/api/v1/auth/users/me")
+    assert response.status_code == status.HTTP_200_OK
+    assert user_cache.stats()["misses"] == before["misses"] + 1
+
+    # The second request resolves the user without touching the database
+    statements.clear()
+    response = client.get("/api/v1/auth/users/me")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["email"] == test_user.email
+    assert statements == []
+    assert user_cache.stats()["hits"] == before["hits"] + 1
+
+
+def test_user_cache_invalidated_on_role_change(
+    admin_client, test_admin, db_session
+):
+    response = admin_client.get("/api/v1/admin/users")
+    assert response.status_code == status.HTTP_200_OK
+
+    admin = db_session.query(User).filter(User.email == test_admin.email).one()
+    admin.role = "user"
+    db_session.commit()
+
+    response = admin_client.get("/api/v1/admin/users")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_login_rehashes_outdated_password_hash(client, db_session):
+    weak_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    user = User(
+        email="weak@example.com",
+        hashed_password=weak_context.hash("testpassword123"),
+        role="user",
+    )
+    db_session.add(user)
+    db_session.commit()
+    assert pwd_context.needs_update(user.hashed_password)
+
+    login_data = {"username": user.email, "password": "testpassword123"}
+    response = client.post("/api/v1/auth/token", data=login_data)
+    assert response.status_code == status.HTTP_200_OK
+
+    user = db_session.query(User).filter(User.email == user.email).one()
+    assert not pwd_context.needs_update(user.hashed_password)
+    assert pwd_context.verify("testpassword123", user.hashed_password)
+
+
+def test_login_when_hashing_queue_is_full(client, test_user):
+    with patch(
+        "app.api.auth.verify_and_update_password",
+        side_effect=PasswordHasherBusyError,
+    ):
+        login_data = {"username": test_user.email, "password": "whatever"}
+        response = client.post("/api/v1/auth/token", data=login_data)
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+from sqlalchemy import event
+
+from app.models.review_card import ReviewCard
+from app.models.word import ApprovalStatus
+
+
+def add_cards(db_session, user_id, word_ids, due_at):
+    db_session.add_all(
+        ReviewCard(user_id=user_id, word_id=word_id, due_at=due_at)
+        for word_id in word_ids
+    )
+    db_session.commit()
+
+
+def test_first_review_enrolls_the_word(client, db_session, add_words):
+    word_ids = add_words(count=2)
+    pending_id = add_words(count=1, approval_status=ApprovalStatus.PENDING)[0]
+
+    response = client.post(
+        "/api/v1/reviews",
+        json={
+            "reviews": [
+                {"word_id": word_ids[0], "grade": 5},
+                {"word_id": word_ids[1], "grade": 1},
+                {"word_id": pending_id, "grade": 5},
+            ]
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["reviewed"] == 2
+    assert [result["status"] for result in data["results"]] == [
+        "reviewed",
+        "reviewed",
+        "not_found",
+    ]
+    assert [result["interval_days"] for result in data["results"]] == [
+        1,
+        1,
+        None,
+    ]
+    assert db_session.query(ReviewCard).count() == 2
+
+
+def test_concurrent_first_reviews_share_one_card(
+    client, db_session, test_user, add_words
+):
+    (word_id,) = add_words("γεια")
+    engine = db_session.get_bind()
+
+    enrolled = []
+
+    def enroll_first(conn, cursor, statement, parameters, *args):
+        # Another batch enrolls the word between the lookup and the insert
+        if statement.startswith("INSERT INTO review_cards") and not enrolled:
+            enrolled.append(word_id)
+            cursor.execute(
+                "INSERT INTO review_cards (user_id, word_id, repetitions, "
+                "interval_days, ease_factor, lapses, due_at) "
+                "VALUES (?, ?, 1, 1, 2.5, 0, ?)",
+                (test_user.id, word_id, datetime.utcnow()),
+            )
+
+    event.listen(engine, "before_cursor_execute", enroll_first)
+    try:
+        response = client.post(
+            "/api/v1/reviews",
+            json={"reviews": [{"word_id": word_id, "grade": 5}]},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", enroll_first)
+    assert enrolled
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["reviewed"] == 1
+
+    # The review is applied to the card the other batch created
+    (card,) = db_session.query(ReviewCard).all()
+    assert card.repetitions == 2
+
+
+def test_reviews_in_a_batch_apply_in_answer_order(
+    client, db_session, add_words
+):
+    word_id = add_words(count=1)[0]
+    now = datetime.utcnow()
+
+    response = client.post(
+        "/api/v1/reviews",
+        json={
+            "reviews": [
+                {
+                    "word_id": word_id,
+                    "grade": 4,
+                    "reviewed_at": (now - timedelta(minutes=1)).isoformat(),
+                },
+                {
+                    "word_id": word_id,
+                    "grade": 4,
+                    "reviewed_at": (now - timedelta(days=2)).isoformat(),
+                },
+            ]
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    # Two passing reviews in a row schedule the second step
+    assert response.json()["results"][0]["interval_days"] == 6
+
+    card = db_session.query(ReviewCard).one()
+    assert card.repetitions == 2
+    assert card.due_at > now + timedelta(days=5)
+
+
+def test_due_cards_are_ordered_and_scoped(
+    client, db_session, test_user, test_admin, add_words
+):
+    user_id, admin_id = test_user.id, test_admin.id
+    word_ids = add_words(count=4)
+    now = datetime.utcnow()
+    add_cards(db_session, user_id, word_ids[:1], now - timedelta(hours=1))
+    add_cards(db_session, user_id, word_ids[1:2], now - timedelta(days=2))
+    add_cards(db_session, user_id, word_ids[2:3], now + timedelta(days=1))
+    add_cards(db_session, admin_id, word_ids[3:], now - timedelta(days=1))
+
+    response = client.get("/api/v1/reviews/due")
+    assert response.status_code == status.HTTP_200_OK
+    cards = response.json()
+    assert [card["id"] for card in cards] == [word_ids[1], word_ids[0]]
+    assert cards[0]["meaning"] == "meaning of λέξη1"
+    assert cards[0]["repetitions"] == 0
+
+
+def test_due_cards_are_one_indexed_range_scan(
+    client, db_session, test_user, statements, add_words
+):
+    user_id = test_user.id
+    word_ids = add_words(count=3)
+    add_cards(db_session, user_id, word_ids, datetime.utcnow())
+
+    statements.clear()
+    client.get("/api/v1/reviews/due")
+    queue = [s for s in statements if "FROM review_cards" in s]
+    assert len(queue) == 1
+
+    # The plan does not depend on the parameter values
+    plan = " ".join(
+        str(row[-1])
+        for row in db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {queue[0]}", (None,) * queue[0].count("?")
+        )
+    )
+    assert (
+        "SEARCH review_cards USING INDEX ix_review_cards_user_id_due_at"
+        in plan
+    )
+
+
+def test_flashcards_can_skip_enrolled_words(
+    client, db_session, test_user, add_words
+):
+    user_id = test_user.id
+    word_ids = add_words(count=5)
+    add_cards(db_session, user_id, word_ids[:3], datetime.utcnow())
+
+    cards = client.get("/api/v1/words/flashcards?unseen=true").json()
+    assert sorted(card["id"] for card in cards) == word_ids[3:]
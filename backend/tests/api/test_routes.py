@@ -0,0 +1,25 @@
+import inspect
+
+from fastapi.routing import APIRoute
+
+from app.db.database import get_db
+from app.main import app
+
+
+def _blocking_async_calls(dependant):
+    # Async callables that receive a sync session would block the event loop
+    receives_db = any(dep.call is get_db for dep in dependant.dependencies)
+    if receives_db and inspect.iscoroutinefunction(dependant.call):
+        yield dependant.call.__name__
+    for dependency in dependant.dependencies:
+        yield from _blocking_async_calls(dependency)
+
+
+def test_async_handlers_do_not_use_blocking_sessions():
+    offenders = {
+        f"{route.path}: {name}"
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for name in _blocking_async_calls(route.dependant)
+    }
+    assert offenders == set()
@@ -1,7 +1,12 @@
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from fastapi import status
 
+from app.core.translation import translate_texts
+from app.models.translation_cache import TranslationCacheEntry
+
 
 @patch("app.core.translation.translate_text")
 def test_translate_to_greek(mock_translate, client):
@@ -59,3 +64,171 @@ def test_translate_special_characters(mock_translate, client):
     assert "translated_text" in data
     assert isinstance(data["translated_text"], str)
     assert len(data["translated_text"]) > 0
+
+
+@patch("app.core.translation.request_translations")
+def test_repeated_translations_are_cached(
+    mock_request, client, cached_translations
+):
+    mock_request.return_value = ["γεια"]
+
+    for _ in range(3):
+        response = client.post(
+            "/api/v1/translation/to-greek", json={"text": "  hello "}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["translated_text"] == "γεια"
+    assert mock_request.await_count == 1
+
+    # With the in-process tier gone the persistent tier still answers
+    cached_translations.clear()
+    response = client.post(
+        "/api/v1/translation/to-greek", json={"text": "hello"}
+    )
+    assert response.json()["translated_text"] == "γεια"
+    assert mock_request.await_count == 1
+
+    # The target language is part of the key
+    mock_request.return_value = ["hello"]
+    response = client.post(
+        "/api/v1/translation/to-english", json={"text": "hello"}
+    )
+    assert response.json()["translated_text"] == "hello"
+    assert mock_request.await_count == 2
+
+    response = client.get("/api/v1/translation/cache/stats")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["memory_hits"] >= 2
+    assert data["persistent_hits"] >= 1
+    assert data["misses"] >= 2
+
+
+def test_expired_translations_are_purged(db_session, cached_translations):
+    db_session.add_all(
+        [
+            TranslationCacheEntry(
+                source_text="old",
+                target_language="el",
+                translated_text="παλιό",
+                created_at=datetime.utcnow() - timedelta(days=365),
+            ),
+            TranslationCacheEntry(
+                source_text="new",
+                target_language="el",
+                translated_text="νέο",
+            ),
+        ]
+    )
+    db_session.commit()
+
+    assert cached_translations.purge_expired(db_session) == 1
+    assert [
+        entry.source_text for entry in db_session.query(TranslationCacheEntry)
+    ] == ["new"]
+
+
+def test_translation_uses_shared_client(client, translation_upstream):
+    response = client.post(
+        "/api/v1/translation/to-greek", json={"text": "good morning"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["translated_text"] == "el:good morning"
+    assert translation_upstream.requests == [
+        {"q": ["good morning"], "target": "el", "format": "text"}
+    ]
+
+
+def test_translation_retries_transient_failures(client, translation_upstream):
+    translation_upstream.failures = 2
+    response = client.post(
+        "/api/v1/translation/to-english", json={"text": "καλημέρα"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["translated_text"] == "en:καλημέρα"
+    assert len(translation_upstream.requests) == 3
+
+
+def test_translation_gives_up_after_retries(client, translation_upstream):
+    translation_upstream.failures = 3
+    response = client.post(
+        "/api/v1/translation/to-english", json={"text": "καλημέρα"}
+    )
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert len(translation_upstream.requests) == 3
+
+
+def test_batch_translation_sends_one_upstream_request(
+    client, translation_upstream
+):
+    client.post("/api/v1/translation/to-greek", json={"text": "cached"})
+
+    response = client.post(
+        "/api/v1/translation/batch",
+        json={
+            "texts": ["one", "two", "one", "cached"],
+            "target_language": "el",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["translations"] == [
+        "el:one",
+        "el:two",
+        "el:one",
+        "el:cached",
+    ]
+    # Cached and duplicate texts are not sent upstream again
+    assert translation_upstream.requests[-1]["q"] == ["one", "two"]
+    assert len(translation_upstream.requests) == 2
+
+
+def test_batch_translation_rejects_empty_text(client):
+    response = client.post(
+        "/api/v1/translation/batch",
+        json={"texts": ["one", " "], "target_language": "el"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_concurrent_translations_share_upstream_call(cached_translations):
+    calls = []
+
+    async def slow_request(texts, target_language):
+        calls.append(texts)
+        await asyncio.sleep(0.1)
+        return [f"{target_language}:{text}" for text in texts]
+
+    async def translate_concurrently():
+        return await asyncio.gather(
+            *(translate_texts(["hello"], "el") for _ in range(5))
+        )
+
+    with patch("app.core.translation.request_translations", slow_request):
+        results = asyncio.run(translate_concurrently())
+
+    assert results == [["el:hello"]] * 5
+    assert calls == [["hello"]]
+
+
+def test_cancelled_translation_is_retried_by_waiters(cached_translations):
+    calls = []
+
+    async def slow_request(texts, target_language):
+        calls.append(texts)
+        await asyncio.sleep(0.1)
+        return [f"{target_language}:{text}" for text in texts]
+
+    async def cancel_owner():
+        owner = asyncio.create_task(translate_texts(["hello"], "el"))
+        while not calls:
+            await asyncio.sleep(0)
+        waiter = asyncio.create_task(translate_texts(["hello"], "el"))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        return await waiter
+
+    with patch("app.core.translation.request_translations", slow_request):
+        result = asyncio.run(cancel_owner())
+
+    assert result == ["el:hello"]
+    assert calls == [["hello"], ["hello"]]
@@ -1,6 +1,18 @@
 from fastapi import status
 
-from app.models.word import ApprovalStatus
+from app.models.meaning import Meaning
+from app.models.word import ApprovalStatus, Word
+
+WORD = {
+    "greek_word": "γεια",
+    "word_type": "noun",
+    "meanings": [{"english_meaning": "hello", "is_primary": True}],
+}
+
+
+def executed(statements):
+    # The leading keywords and table of every statement, in order
+    return [" ".join(s.split()[:3]) for s in statements]
 
 
 def test_approve_word(admin_client, client):
@@ -51,3 +63,60 @@ def test_reject_word(admin_client, client):
     response = admin_client.post(f"/api/v1/words/{word_id}/reject")
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["approval_status"] == ApprovalStatus.REJECTED.value
+
+
+def test_moderation_writes_the_word_with_one_update(
+    admin_client, client, statements
+):
+    word_id = client.post("/api/v1/words/", json=WORD).json()["id"]
+    # Cache the admin principal, looked up once per token
+    admin_client.get(f"/api/v1/words/{word_id}")
+    # Only the word itself is written by a single UPDATE ... RETURNING,
+    # which also reads the previous status; the response's relationships
+    # are loaded after it and the dictionary version is bumped on commit
+    moderation = [
+        "WITH previous AS",
+        "SELECT users.id AS",
+        "SELECT meanings.word_id AS",
+    ]
+    commit = ["INSERT INTO dictionary_version", "UPDATE words SET"]
+
+    for action in ("reject", "approve", "reject"):
+        statements.clear()
+        response = admin_client.post(f"/api/v1/words/{word_id}/{action}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["meanings"][0]["english_meaning"] == "hello"
+        # Approvals are also counted for the activity analytics
+        activity = ["INSERT INTO daily_stats"] if action == "approve" else []
+        assert executed(statements) == moderation + activity + commit
+        assert "RETURNING" in statements[0]
+
+    statements.clear()
+    response = admin_client.post("/api/v1/words/9999/approve")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert executed(statements) == ["WITH previous AS"]
+
+
+def test_delete_cascades_in_the_database(
+    admin_client, client, db_session, statements
+):
+    word_id = client.post("/api/v1/words/", json=WORD).json()["id"]
+    # Cache the admin principal, looked up once per token
+    admin_client.get(f"/api/v1/words/{word_id}")
+
+    statements.clear()
+    response = admin_client.delete(f"/api/v1/words/{word_id}")
+    assert response.status_code == status.HTTP_200_OK
+    # The meanings go through ON DELETE CASCADE, then the commit bumps the
+    # dictionary version and leaves a tombstone
+    assert statements[0] == "DELETE FROM words WHERE words.id = ? RETURNING id"
+    assert executed(statements) == [
+        "DELETE FROM words",
+        "INSERT INTO dictionary_version",
+        "INSERT INTO deleted_words",
+    ]
+    assert db_session.query(Word).count() == 0
+    assert db_session.query(Meaning).count() == 0
+
+    response = admin_client.delete(f"/api/v1/words/{word_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
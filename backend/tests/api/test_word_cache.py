@@ -0,0 +1,142 @@
+from fastapi import status
+
+from app.core.response_cache import (
+    RedisBackend,
+    ResponseCache,
+    word_list_cache,
+)
+
+NEW_WORD = {
+    "greek_word": "νερό",
+    "word_type": "noun",
+    "meanings": [{"english_meaning": "water", "is_primary": True}],
+}
+
+
+def queried_words(statements, request):
+    statements.clear()
+    response = request()
+    assert response.status_code == status.HTTP_200_OK
+    return any("FROM words" in s for s in statements), response.json()
+
+
+def test_repeated_listings_are_served_from_cache(
+    client, db_session, statements, add_words
+):
+    add_words("γεια")
+    before = word_list_cache.stats()
+    listing = lambda: client.get("/api/v1/words/?size=10")  # noqa: E731
+
+    queried, first = queried_words(statements, listing)
+    assert queried
+    queried, second = queried_words(statements, listing)
+    assert not queried
+    assert second == first
+
+    # Defaults and explicit values share an entry, and users cannot reach
+    # the pending namespace
+    queried, _ = queried_words(
+        statements,
+        lambda: client.get(
+            "/api/v1/words/?size=10&page=1&include_pending=true"
+        ),
+    )
+    assert not queried
+
+    stats = word_list_cache.stats()
+    assert stats["backend"] == "memory"
+    assert stats["hits"] - before["hits"] == 2
+    assert stats["misses"] - before["misses"] == 1
+
+
+def test_pending_changes_keep_approved_listings_cached(
+    client, admin_client, db_session, statements, add_words
+):
+    add_words("γεια")
+    approved = lambda: client.get("/api/v1/words/")  # noqa: E731
+    everything = lambda: admin_client.get(  # noqa: E731
+        "/api/v1/words/?include_pending=true"
+    )
+    queried_words(statements, approved)
+    queried_words(statements, everything)
+
+    # A submission is pending, so only the admin view changes
+    word_id = client.post("/api/v1/words/", json=NEW_WORD).json()["id"]
+    queried, data = queried_words(statements, approved)
+    assert not queried
+    assert data["total"] == 1
+    queried, data = queried_words(statements, everything)
+    assert queried
+    assert data["total"] == 2
+
+    # Rejecting a pending word does not change what users see either
+    admin_client.post(f"/api/v1/words/{word_id}/reject")
+    queried, _ = queried_words(statements, approved)
+    assert not queried
+
+    # Approving it does
+    admin_client.post(f"/api/v1/words/{word_id}/approve")
+    queried, data = queried_words(statements, approved)
+    assert queried
+    assert data["total"] == 2
+
+
+def test_approved_changes_invalidate_listings(
+    client, admin_client, db_session, statements, add_words
+):
+    (word_id,) = add_words("γεια")
+    approved = lambda: client.get("/api/v1/words/")  # noqa: E731
+    queried_words(statements, approved)
+
+    admin_client.put(f"/api/v1/words/{word_id}", json=NEW_WORD)
+    queried, data = queried_words(statements, approved)
+    assert queried
+    assert data["items"][0]["greek_word"] == "νερό"
+
+    admin_client.delete(f"/api/v1/words/{word_id}")
+    queried, data = queried_words(statements, approved)
+    assert queried
+    assert data["total"] == 0
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def scan_iter(self, match):
+        return [key for key in self.values if key.startswith(match[:-1])]
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_redis_backend():
+    client = FakeRedis()
+    cache = ResponseCache(RedisBackend(client, ttl_seconds=60))
+    assert cache.get("a") is None
+    cache.set("a", b"{}")
+    assert client.values == {"words:a": b"{}"}
+    assert cache.get("a") == b"{}"
+
+    stats = cache.stats()
+    assert stats["backend"] == "redis"
+    assert stats["hit_ratio"] == 0.5
+    assert stats["size"] is None
+
+    cache.clear()
+    assert client.values == {}
+
+
+def test_response_cache_metrics(admin_client, client):
+    response = admin_client.get("/api/v1/admin/metrics/response-cache")
+    assert response.status_code == status.HTTP_200_OK
+    assert "hit_ratio" in response.json()
+
+    response = client.get("/api/v1/admin/metrics/response-cache")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
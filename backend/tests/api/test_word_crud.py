@@ -1,5 +1,6 @@
 from fastapi import status
 
+from app.models.meaning import Meaning as DBMeaning
 from app.models.word import ApprovalStatus
 from app.models.word import Word as DBWord
 
@@ -64,3 +65,69 @@ def test_read_words(client, db_session):
 def test_read_word_not_found(client):
     response = client.get("/api/v1/words/999")
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_search_words_by_meaning_and_relevance(client, db_session):
+    db_session.add_all(
+        [
+            DBWord(
+                greek_word="καλησπέρα",
+                word_type="noun",
+                approval_status=ApprovalStatus.APPROVED,
+                meanings=[DBMeaning(english_meaning="good evening")],
+            ),
+            DBWord(
+                greek_word="καλή",
+                word_type="adjective",
+                approval_status=ApprovalStatus.APPROVED,
+                meanings=[DBMeaning(english_meaning="good")],
+            ),
+            DBWord(
+                greek_word="ακαλή",
+                word_type="adjective",
+                approval_status=ApprovalStatus.APPROVED,
+            ),
+        ]
+    )
+    db_session.commit()
+
+    # Matches on english meanings
+    response = client.get("/api/v1/words/?search=evening")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["greek_word"] for item in data["items"]] == ["καλησπέρα"]
+
+    # Exact and prefix matches rank ahead of substring matches
+    response = client.get("/api/v1/words/?search=καλή&sort=relevance")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["greek_word"] for item in data["items"]] == [
+        "καλή",
+        "καλησπέρα",
+        "ακαλή",
+    ]
+    assert data["next_cursor"] is None
+
+
+def test_search_ignores_accents_and_case(client, db_session):
+    db_session.add(
+        DBWord(
+            greek_word="Καλημέρα",
+            word_type="noun",
+            approval_status=ApprovalStatus.APPROVED,
+        )
+    )
+    db_session.commit()
+
+    for search, match in [
+        ("καλημερα", "exact"),
+        ("ΚΑΛΗΜΕ", "prefix"),
+        ("ΛΗΜΈΡ", "contains"),
+    ]:
+        response = client.get(f"/api/v1/words/?search={search}&match={match}")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["greek_word"] for item in data["items"]] == ["Καλημέρα"]
+
+    response = client.get("/api/v1/words/?search=καλη&match=exact")
+    assert response.json()["items"] == []
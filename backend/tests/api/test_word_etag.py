@@ -0,0 +1,104 @@
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+from fastapi import status
+
+from app.models.dictionary_version import get_dictionary_version
+
+
+def test_word_writes_bump_dictionary_version(db_session, add_words):
+    assert get_dictionary_version(db_session)[0] == 0
+    add_words("γεια")
+    state = get_dictionary_version(db_session)
+    assert state.version == 1
+    assert state.approved_version == 1
+    assert state.updated_at is not None
+
+    # Transactions that do not touch words leave the version alone
+    db_session.commit()
+    assert get_dictionary_version(db_session)[0] == 1
+
+
+def test_read_words_conditional_get(client, db_session, statements, add_words):
+    add_words("γεια")
+
+    response = client.get("/api/v1/words/")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "last-modified" in response.headers
+
+    statements.clear()
+    response = client.get("/api/v1/words/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    # Only the version is read, the words are not queried
+    assert not any("FROM words" in s for s in statements)
+
+    # Different query parameters are a different representation
+    response = client.get(
+        "/api/v1/words/?size=10", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # Any change to the dictionary invalidates the tag
+    add_words("νερό")
+    response = client.get("/api/v1/words/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 2
+
+
+def test_read_word_conditional_get(
+    client, admin_client, db_session, add_words
+):
+    (word_id,) = add_words("γεια")
+
+    response = client.get(f"/api/v1/words/{word_id}")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = client.get(
+        f"/api/v1/words/{word_id}",
+        headers={"If-None-Match": f'"other", {etag}'},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.get(
+        f"/api/v1/words/{word_id}",
+        headers={"If-Modified-Since": last_modified},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Updating the meanings changes the representation
+    admin_client.put(
+        f"/api/v1/words/{word_id}",
+        json={
+            "greek_word": "γεια",
+            "word_type": "noun",
+            "meanings": [{"english_meaning": "hi", "is_primary": True}],
+        },
+    )
+    response = client.get(
+        f"/api/v1/words/{word_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["meanings"][0]["english_meaning"] == "hi"
+
+
+def test_bulk_writes_bump_dictionary_version(
+    admin_client, db_session, add_words
+):
+    (word_id,) = add_words("γεια")
+    version = get_dictionary_version(db_session)[0]
+
+    admin_client.post("/api/v1/words/bulk/reject", json={"ids": [word_id]})
+    db_session.rollback()
+    assert get_dictionary_version(db_session)[0] == version + 1
+
+    # An old timestamp is no reason to answer 304
+    old = format_datetime(datetime(2000, 1, 1, tzinfo=UTC), usegmt=True)
+    response = admin_client.get(
+        f"/api/v1/words/{word_id}", headers={"If-Modified-Since": old}
+    )
+    assert response.status_code == status.HTTP_200_OK
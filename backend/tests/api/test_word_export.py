@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+
+from fastapi import status
+
+from app.core.exporter import iter_words
+from app.core.importer import parse_csv
+from app.models.word import ApprovalStatus
+from app.models.word import Word as DBWord
+
+
+def seed_words(add_words):
+    add_words(
+        "καλημέρα",
+        gender="feminine",
+        notes="Greeting, formal",
+        meanings=["good morning", "morning greeting"],
+    )
+    add_words("τρέχω", word_type="verb", meanings=["run"])
+    add_words("σπίτι", gender="neuter", meanings=["house"])
+    add_words(
+        "αναμονή",
+        gender="feminine",
+        meanings=["waiting"],
+        approval_status=ApprovalStatus.PENDING,
+    )
+
+
+def test_export_ndjson(client, db_session, add_words):
+    seed_words(add_words)
+
+    response = client.get("/api/v1/words/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    # Approved words only, in greek_word order
+    assert [row["greek_word"] for row in rows] == [
+        "καλημέρα",
+        "σπίτι",
+        "τρέχω",
+    ]
+    assert rows[0]["gender"] == "feminine"
+    assert rows[0]["meanings"] == [
+        {"english_meaning": "good morning", "is_primary": True},
+        {"english_meaning": "morning greeting", "is_primary": False},
+    ]
+
+
+def test_export_csv_round_trips(client, db_session, add_words):
+    seed_words(add_words)
+
+    response = client.get("/api/v1/words/export?format=csv")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "words.csv" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3
+    assert rows[0]["notes"] == "Greeting, formal"
+    assert rows[0]["meanings"] == "good morning;morning greeting"
+
+    # The export is valid importer input
+    parsed = [data for _, data, _ in parse_csv(io.StringIO(response.text))]
+    assert parsed[0]["meanings"][0] == {
+        "english_meaning": "good morning",
+        "is_primary": True,
+    }
+
+
+def test_export_filters(client, admin_client, db_session, add_words):
+    seed_words(add_words)
+
+    response = client.get("/api/v1/words/export?word_type=verb")
+    assert [
+        json.loads(line)["greek_word"] for line in response.text.splitlines()
+    ] == ["τρέχω"]
+
+    response = client.get("/api/v1/words/export?search=σπιτι&match=exact")
+    assert len(response.text.splitlines()) == 1
+
+    # Pending words are only exported for admins
+    response = client.get("/api/v1/words/export?include_pending=true")
+    assert len(response.text.splitlines()) == 3
+    response = admin_client.get("/api/v1/words/export?include_pending=true")
+    assert len(response.text.splitlines()) == 4
+
+
+def test_export_rejects_unknown_format(client):
+    response = client.get("/api/v1/words/export?format=xml")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_iter_words_batches_meaning_loads(db_session, statements, add_words):
+    seed_words(add_words)
+    statements.clear()
+
+    words = list(iter_words(db_session, [], batch_size=2))
+    assert len(words) == 4
+
+    # One meanings query per batch rather than one per word
+    meaning_selects = [
+        s for s in statements if s.startswith("SELECT meanings")
+    ]
+    assert len(meaning_selects) == 2
+    # Consumed batches are released from the session
+    assert not any(isinstance(obj, DBWord) for obj in db_session)
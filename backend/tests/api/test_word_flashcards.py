@@ -0,0 +1,91 @@
+import random
+
+from fastapi import status
+
+from app.core.sampling import sample_ids
+from app.models.word import ApprovalStatus
+from app.models.word import Word as DBWord
+
+
+def test_flashcards_return_compact_random_cards(client, db_session, add_words):
+    # The primary meaning is not the first one
+    add_words(count=30, meanings=["other", "word"], primary=1)
+    add_words(count=5, approval_status=ApprovalStatus.PENDING)
+
+    response = client.get("/api/v1/words/flashcards?count=10")
+    assert response.status_code == status.HTTP_200_OK
+    cards = response.json()
+    assert len(cards) == 10
+    assert len({card["id"] for card in cards}) == 10
+    assert set(cards[0]) == {
+        "id",
+        "greek_word",
+        "word_type",
+        "gender",
+        "notes",
+        "meaning",
+    }
+    # The primary meaning is shown
+    assert cards[0]["meaning"] == "word"
+
+
+def test_flashcards_filters(client, db_session, add_words):
+    add_words(count=10)
+    verb_ids = add_words(count=3, word_type="verb")
+
+    cards = client.get("/api/v1/words/flashcards?word_type=verb").json()
+    assert sorted(card["id"] for card in cards) == verb_ids
+
+    # Pending words never make it into a deck
+    add_words(
+        count=3,
+        word_type="adjective",
+        approval_status=ApprovalStatus.PENDING,
+    )
+    cards = client.get("/api/v1/words/flashcards?word_type=adjective").json()
+    assert cards == []
+
+
+def test_sample_ids_seeks_instead_of_sorting(
+    db_session, statements, add_words
+):
+    word_ids = add_words(count=50)
+    statements.clear()
+
+    sample = sample_ids(db_session, DBWord.id, 10, rng=random.Random(7))
+    assert len(sample) == 10
+    assert len(set(sample)) == 10
+    assert set(sample) <= set(word_ids)
+    assert not any("random()" in s.lower() for s in statements)
+    # The bounds, then one statement per probing round
+    assert len(statements) <= 4
+
+
+def test_sample_ids_on_empty_table(db_session):
+    assert sample_ids(db_session, DBWord.id, 10) == []
+
+
+def test_sample_ids_with_filtered_rows_at_low_ids(db_session, add_words):
+    adjective_ids = add_words(count=30, word_type="adjective")
+    add_words(count=500)
+
+    for seed in range(5):
+        sample = sample_ids(
+            db_session,
+            DBWord.id,
+            20,
+            [DBWord.word_type == "adjective"],
+            rng=random.Random(seed),
+        )
+        assert len(sample) == 20
+        assert len(set(sample)) == 20
+        assert set(sample) <= set(adjective_ids)
+
+
+def test_sample_ids_falls_back_to_sorting(db_session, statements, add_words):
+    word_ids = add_words(count=3)
+    statements.clear()
+
+    sample = sample_ids(db_session, DBWord.id, 10, rng=random.Random(7))
+    assert sorted(sample) == word_ids
+    assert "random()" in statements[-1].lower()
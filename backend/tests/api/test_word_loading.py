@@ -0,0 +1,72 @@
+from fastapi import status
+
+from app.core.response_cache import word_list_cache
+from app.models.word import ApprovalStatus
+from app.models.word import Word as DBWord
+
+
+def _count_statements(statements, request):
+    # Warm up so the cached current user does not skew the count, then
+    # drop the cached listing so the query runs again
+    request()
+    word_list_cache.clear()
+    statements.clear()
+    response = request()
+    assert response.status_code == status.HTTP_200_OK
+    return len(statements), response.json()
+
+
+def test_read_words_statement_count_is_fixed(
+    client, db_session, statements, add_words
+):
+    add_words(count=2, meanings=["word", "term"])
+    small, data = _count_statements(
+        statements, lambda: client.get("/api/v1/words/")
+    )
+    assert all(len(item["meanings"]) == 2 for item in data["items"])
+
+    add_words(count=20, meanings=["word", "term"])
+    large, data = _count_statements(
+        statements, lambda: client.get("/api/v1/words/")
+    )
+    assert len(data["items"]) == 22
+    assert large == small
+
+
+def test_pending_words_statement_count_is_fixed(
+    admin_client, db_session, statements, add_words
+):
+    add_words(
+        count=2,
+        meanings=["word", "term"],
+        approval_status=ApprovalStatus.PENDING,
+    )
+    small, _ = _count_statements(
+        statements, lambda: admin_client.get("/api/v1/words/pending")
+    )
+
+    add_words(
+        count=20,
+        meanings=["word", "term"],
+        approval_status=ApprovalStatus.PENDING,
+    )
+    large, data = _count_statements(
+        statements, lambda: admin_client.get("/api/v1/words/pending")
+    )
+    assert len(data["items"]) == 22
+    assert large == small
+
+
+def test_read_word_loads_meanings_eagerly(
+    client, db_session, statements, add_words
+):
+    add_words(count=1, meanings=["word", "term"])
+    word_id = db_session.query(DBWord.id).scalar()
+
+    # One statement for the dictionary version validating the response, one
+    # for the word with its submitter and one for its meanings
+    count, data = _count_statements(
+        statements, lambda: client.get(f"/api/v1/words/{word_id}")
+    )
+    assert len(data["meanings"]) == 2
+    assert count == 3
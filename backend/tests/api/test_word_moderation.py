@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+
+from app.core.pagination import encode_cursor
+from app.models.word import ApprovalStatus
+from app.models.word import Word as DBWord
+
+
+def statuses(db_session):
+    db_session.expire_all()
+    return {
+        word.greek_word: word.approval_status
+        for word in db_session.query(DBWord)
+    }
+
+
+def test_bulk_approve_by_ids(admin_client, db_session, statements, add_words):
+    ids = add_words(
+        "ένα", "δύο", "τρία", approval_status=ApprovalStatus.PENDING
+    )
+    statements.clear()
+
+    response = admin_client.post(
+        "/api/v1/words/bulk/approve", json={"ids": [ids[0], ids[1], 9999]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["approval_status"] == "approved"
+    assert data["updated"] == 2
+    assert data["results"] == [
+        {"id": ids[0], "status": "updated"},
+        {"id": ids[1], "status": "updated"},
+        {"id": 9999, "status": "not_found"},
+    ]
+    assert statuses(db_session) == {
+        "ένα": ApprovalStatus.APPROVED,
+        "δύο": ApprovalStatus.APPROVED,
+        "τρία": ApprovalStatus.PENDING,
+    }
+
+    # A single set-based statement regardless of the number of ids, plus
+    # one stamping the sync version of the updated words
+    writes = [s for s in statements if "UPDATE words" in s]
+    assert len(writes) == 2
+    assert sum("approval_status" in s for s in writes) == 1
+
+
+def test_bulk_reject_by_filter(admin_client, db_session, add_words):
+    add_words(
+        "τρέχω",
+        "γράφω",
+        word_type="verb",
+        approval_status=ApprovalStatus.PENDING,
+    )
+    add_words("σπίτι", approval_status=ApprovalStatus.PENDING)
+    db_session.add(
+        DBWord(
+            greek_word="παίζω",
+            word_type="verb",
+            approval_status=ApprovalStatus.APPROVED,
+        )
+    )
+    db_session.commit()
+
+    response = admin_client.post(
+        "/api/v1/words/bulk/reject", json={"filter": {"word_type": "verb"}}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["updated"] == 2
+    assert {result["status"] for result in data["results"]} == {"updated"}
+
+    # Filters only touch the pending queue
+    assert statuses(db_session) == {
+        "τρέχω": ApprovalStatus.REJECTED,
+        "γράφω": ApprovalStatus.REJECTED,
+        "σπίτι": ApprovalStatus.PENDING,
+        "παίζω": ApprovalStatus.APPROVED,
+    }
+
+
+def test_bulk_moderation_requires_ids_or_filter(admin_client):
+    for payload in ({}, {"ids": [1], "filter": {}}, {"ids": []}):
+        response = admin_client.post(
+            "/api/v1/words/bulk/approve", json=payload
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_bulk_moderation_requires_admin(client, db_session, add_words):
+    ids = add_words("ένα", approval_status=ApprovalStatus.PENDING)
+    response = client.post("/api/v1/words/bulk/approve", json={"ids": ids})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_pending_queue_is_paginated_oldest_first(admin_client, db_session):
+    start = datetime(2024, 1, 1)
+    db_session.add_all(
+        DBWord(
+            greek_word=f"λέξη{i}",
+            word_type="noun",
+            approval_status=ApprovalStatus.PENDING,
+            # Two words share each timestamp to exercise the id tiebreak
+            created_at=start + timedelta(minutes=(4 - i) // 2),
+        )
+        for i in range(5)
+    )
+    db_session.add(
+        DBWord(
+            greek_word="εγκεκριμένη",
+            word_type="noun",
+            approval_status=ApprovalStatus.APPROVED,
+            created_at=start,
+        )
+    )
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"size": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = admin_client.get("/api/v1/words/pending", params=params).json()
+        assert data["total"] == 5
+        seen.extend(data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 5
+    assert len({item["id"] for item in seen}) == 5
+    keys = [(item["created_at"], item["id"]) for item in seen]
+    assert keys == sorted(keys)
+    assert seen[0]["greek_word"] in ("λέξη3", "λέξη4")
+
+
+def test_pending_queue_rejects_invalid_cursor(admin_client):
+    response = admin_client.get(
+        "/api/v1/words/pending", params={"cursor": "bm9wZQ"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_pending_queue_rejects_mistyped_cursor(admin_client):
+    for cursor in (
+        encode_cursor("2024-01-01T00:00:00", "1"),
+        encode_cursor(1, 1),
+    ):
+        response = admin_client.get(
+            "/api/v1/words/pending", params={"cursor": cursor}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_pending_queue_requires_admin(client):
+    response = client.get("/api/v1/words/pending")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
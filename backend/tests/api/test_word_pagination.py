@@ -0,0 +1,55 @@
+from fastapi import status
+
+from app.core.pagination import encode_cursor
+
+
+def test_cursor_pagination_walks_all_pages(client, db_session, add_words):
+    # Duplicate greek words exercise the id tie-breaker
+    add_words("α", "β", "β", "γ", "δ")
+
+    seen = []
+    response = client.get("/api/v1/words/?size=2&include_total=false")
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] is None
+        assert data["pages"] is None
+        seen.extend(item["id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        response = client.get(
+            "/api/v1/words/?size=2&include_total=false"
+            f"&cursor={data['next_cursor']}"
+        )
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+def test_offset_pagination_returns_next_cursor(client, db_session, add_words):
+    add_words("α", "β", "γ")
+
+    response = client.get("/api/v1/words/?size=2")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 3
+    assert data["pages"] == 2
+    assert [item["greek_word"] for item in data["items"]] == ["α", "β"]
+
+    response = client.get(
+        f"/api/v1/words/?size=2&cursor={data['next_cursor']}"
+    )
+    data = response.json()
+    assert [item["greek_word"] for item in data["items"]] == ["γ"]
+    assert data["next_cursor"] is None
+
+
+def test_invalid_cursor(client):
+    response = client.get("/api/v1/words/?cursor=not-a-cursor")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cursor_with_mistyped_values(client):
+    for cursor in (encode_cursor("α", "1"), encode_cursor(1, 1)):
+        response = client.get(f"/api/v1/words/?cursor={cursor}")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
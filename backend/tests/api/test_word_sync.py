@@ -0,0 +1,81 @@
+from fastapi import status
+
+from app.models.word import Word as DBWord
+
+NEW_WORD = {
+    "greek_word": "νερό",
+    "word_type": "noun",
+    "meanings": [{"english_meaning": "water", "is_primary": True}],
+}
+
+
+def sync(client, token=None, **params):
+    if token:
+        params["since"] = token
+    response = client.get("/api/v1/words/changes", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_changes_since_token(client, admin_client, db_session, add_words):
+    word_ids = add_words("ένα", "δύο")
+
+    first = sync(client)
+    assert [word["id"] for word in first["words"]] == word_ids
+    assert first["words"][0]["updated_at"]
+    assert not first["has_more"]
+
+    # Nothing changed
+    data = sync(client, first["next_token"])
+    assert data["words"] == [] and data["deleted"] == []
+
+    admin_client.put(f"/api/v1/words/{word_ids[1]}", json=NEW_WORD)
+    admin_client.delete(f"/api/v1/words/{word_ids[0]}")
+    # Pending submissions stay out of the feed until approved
+    pending_id = client.post("/api/v1/words/", json=NEW_WORD).json()["id"]
+
+    data = sync(client, first["next_token"])
+    assert [word["greek_word"] for word in data["words"]] == ["νερό"]
+    assert data["deleted"] == [word_ids[0], pending_id]
+
+    admin_client.post(f"/api/v1/words/{pending_id}/approve")
+    data = sync(client, data["next_token"])
+    assert [word["id"] for word in data["words"]] == [pending_id]
+    assert data["deleted"] == []
+
+
+def test_changes_page_within_one_version(client, db_session, add_words):
+    word_ids = add_words(*(f"λέξη{i}" for i in range(5)))
+    token = sync(client)["next_token"]
+    deleted_id = add_words("διαγραφή")[0]
+    db_session.delete(db_session.get(DBWord, deleted_id))
+    db_session.commit()
+
+    # Touch every word in one transaction, so they share a sync version
+    for word in db_session.query(DBWord):
+        word.notes = "updated"
+    db_session.commit()
+
+    seen, deleted, pages = [], [], 0
+    while True:
+        data = sync(client, token, limit=2)
+        seen += [word["id"] for word in data["words"]]
+        deleted += data["deleted"]
+        token = data["next_token"]
+        pages += 1
+        if not data["has_more"]:
+            break
+    assert seen == word_ids
+    assert deleted == [deleted_id]
+    assert pages == 3
+
+
+def test_pending_words_sync_for_admins(admin_client, client):
+    word_id = client.post("/api/v1/words/", json=NEW_WORD).json()["id"]
+    data = sync(admin_client, include_pending=True)
+    assert [word["id"] for word in data["words"]] == [word_id]
+
+
+def test_invalid_sync_token(client, db_session):
+    response = client.get("/api/v1/words/changes?since=garbage")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -112,3 +112,94 @@ def test_update_approved_word_as_regular_user(
     }
     response = client.put(f"/api/v1/words/{word_id}", json=updated_data)
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def create_word(client):
+    response = client.post(
+        "/api/v1/words/",
+        json={
+            "greek_word": "γεια",
+            "word_type": WordType.NOUN,
+            "notes": "A greeting",
+            "meanings": [
+                {"english_meaning": "hello", "is_primary": True},
+                {"english_meaning": "bye", "is_primary": False},
+            ],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def test_update_diffs_meanings_by_id(admin_client, db_session, statements):
+    word = create_word(admin_client)
+    hello, bye = word["meanings"]
+
+    statements.clear()
+    response = admin_client.put(
+        f"/api/v1/words/{word['id']}",
+        json={
+            "greek_word": "γεια",
+            "word_type": WordType.NOUN,
+            "notes": "A greeting",
+            "meanings": [
+                {**hello, "english_meaning": "hi"},
+                {"english_meaning": "good day", "is_primary": False},
+            ],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    meanings = {
+        m["english_meaning"]: m["id"] for m in response.json()["meanings"]
+    }
+    assert meanings["hi"] == hello["id"]
+    assert bye["id"] not in meanings.values()
+    assert "good day" in meanings
+
+    # One statement per kind of change, and no rewrite of the word
+    writes = [
+        s.split(" WHERE")[0]
+        for s in statements
+        if s.startswith(("INSERT INTO meanings", "UPDATE", "DELETE"))
+    ]
+    assert sorted(w for w in writes if "meanings" in w) == [
+        "DELETE FROM meanings",
+        "INSERT INTO meanings (english_meaning, is_primary, word_id, "
+        "updated_at) VALUES (?, ?, ?, ?)",
+        "UPDATE meanings SET english_meaning=?, updated_at=?",
+    ]
+    assert not any("SET greek_word" in w for w in writes)
+
+
+def test_patch_touches_only_sent_fields(admin_client, db_session, statements):
+    word = create_word(admin_client)
+    # Admin edits approve pending words, which would also be written
+    admin_client.post(f"/api/v1/words/{word['id']}/approve")
+
+    statements.clear()
+    response = admin_client.patch(
+        f"/api/v1/words/{word['id']}", json={"notes": "Informal"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["notes"] == "Informal"
+    assert data["meanings"] == word["meanings"]
+
+    updates = [s for s in statements if s.startswith("UPDATE words SET")]
+    assert updates[0].startswith("UPDATE words SET notes=? WHERE")
+    assert not any("meanings" in s for s in statements if "SELECT" not in s)
+
+
+def test_patch_validation(admin_client, db_session):
+    word = create_word(admin_client)
+
+    response = admin_client.patch(
+        f"/api/v1/words/{word['id']}", json={"greek_word": None}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    response = admin_client.patch(
+        f"/api/v1/words/{word['id']}",
+        json={"meanings": [{"id": 999, "english_meaning": "x"}]},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,13 +1,23 @@
+import httpx
 import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core import translation
+from app.core.config import settings
+from app.core.response_cache import word_list_cache
 from app.core.security import create_access_token
+from app.core.translation import translation_cache
+from app.core.user_cache import user_cache
 from app.db.database import Base, get_db
 from app.main import app
+from app.models.meaning import Meaning
 from app.models.user import User
+from app.models.word import ApprovalStatus, Word
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite://"
@@ -21,6 +31,26 @@ TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
 
+# The background rollup would refresh the application database, not the
+# test one; tests refresh daily_stats explicitly
+settings.DAILY_STATS_REFRESH_SECONDS = 0
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    # Cached principals must not outlive the database they were read from
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_word_list_cache():
+    # Every test starts over from dictionary version zero
+    word_list_cache.clear()
+    yield
+    word_list_cache.clear()
+
 
 @pytest.fixture(scope="function")
 def db_session():
@@ -33,6 +63,70 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def statements():
+    # Record every SQL statement sent to the test database
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def add_words(db_session):
+    """
+    Commit words in one transaction and return their ids, in order.
+
+    Words are named by the positional arguments, or λέξη0, λέξη1, ... up
+    to count when there are none. Every word gets the English meanings
+    given, the one at index primary marked primary, or by default one
+    primary meaning "meaning of <greek word>". Other keyword arguments
+    are set on every word, which default to approved nouns.
+    """
+
+    def add(*greek_words, count=1, meanings=None, primary=0, **fields):
+        fields.setdefault("word_type", "noun")
+        fields.setdefault("approval_status", ApprovalStatus.APPROVED)
+        greek_words = greek_words or [f"λέξη{i}" for i in range(count)]
+        words = [
+            Word(
+                greek_word=greek_word,
+                meanings=[
+                    Meaning(english_meaning=meaning, is_primary=i == primary)
+                    for i, meaning in enumerate(
+                        meanings
+                        if meanings is not None
+                        else [f"meaning of {greek_word}"]
+                    )
+                ],
+                **fields,
+            )
+            for greek_word in greek_words
+        ]
+        db_session.add_all(words)
+        db_session.flush()
+        word_ids = [word.id for word in words]
+        db_session.commit()
+        return word_ids
+
+    return add
+
+
+@pytest.fixture(scope="function")
+def cached_translations(db_session):
+    # Point the persistent translation cache tier at the test database
+    session_factory = translation_cache.session_factory
+    translation_cache.session_factory = TestingSessionLocal
+    translation_cache.clear()
+    yield translation_cache
+    translation_cache.clear()
+    translation_cache.session_factory = session_factory
+
+
 @pytest.fixture(scope="function")
 def test_user(db_session):
     user = User(
@@ -97,3 +191,50 @@ def admin_client(db_session, test_admin):
         }
         yield test_client
     app.dependency_overrides.clear()
+
+
+class StandInTranslationAPI:
+    """Local stand-in for the Google Translate API."""
+
+    def __init__(self):
+        self.requests = []
+        self.failures = 0
+        self.app = FastAPI()
+        self.app.post("/v2")(self.translate)
+
+    async def translate(self, request: Request):
+        payload = await request.json()
+        self.requests.append(payload)
+        if self.failures:
+            self.failures -= 1
+            return JSONResponse({"error": "unavailable"}, status_code=503)
+        texts = (
+            payload["q"] if isinstance(payload["q"], list) else [payload["q"]]
+        )
+        return {
+            "data": {
+                "translations": [
+                    {"translatedText": f"{payload['target']}:{text}"}
+                    for text in texts
+                ]
+            }
+        }
+
+
+@pytest.fixture(scope="function")
+def translation_upstream(client, cached_translations, monkeypatch):
+    # Route the shared translation HTTP client to the local stand-in
+    upstream = StandInTranslationAPI()
+    monkeypatch.setattr(
+        settings, "GOOGLE_TRANSLATE_API_URL", "http://translate.test/v2"
+    )
+    monkeypatch.setattr(settings, "GOOGLE_TRANSLATE_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "TRANSLATION_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(
+        translation,
+        "_http_client",
+        translation.create_http_client(
+            transport=httpx.ASGITransport(app=upstream.app)
+        ),
+    )
+    yield upstream
@@ -0,0 +1,51 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hits_and_misses():
+    cache = TTLCache(max_size=2, ttl_seconds=10)
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_entries_expire():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("a", 1)
+    clock.now = 9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_disabled_with_zero_size():
+    cache = TTLCache(max_size=0, ttl_seconds=10)
+    cache.set("a", 1)
+    assert cache.get("a") is None
@@ -0,0 +1,20 @@
+from app.core.greek import normalize_greek
+
+
+def test_normalize_greek_strips_accents_and_case():
+    assert normalize_greek("Καλημέρα") == "καλημερα"
+    assert normalize_greek("ΚΑΛΗΜΈΡΑ") == "καλημερα"
+
+
+def test_normalize_greek_strips_dialytika():
+    assert normalize_greek("Προϊόν") == "προιον"
+    assert normalize_greek("ΐ") == "ι"
+
+
+def test_normalize_greek_folds_final_sigma():
+    assert normalize_greek("λόγος") == "λογοσ"
+    assert normalize_greek("ΛΟΓΟΣ") == normalize_greek("λόγος")
+
+
+def test_normalize_greek_none():
+    assert normalize_greek(None) is None
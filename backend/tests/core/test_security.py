@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from app.core.security import PasswordHasher, PasswordHasherBusyError
+
+
+def test_password_hasher_runs_and_records_stats():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    assert hasher.run(lambda value: value * 2, 21) == 42
+
+    stats = hasher.stats()
+    assert stats["completed"] == 1
+    assert stats["running"] == 0
+    assert stats["queued"] == 0
+
+
+def test_password_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(timeout=5)
+
+    worker = threading.Thread(target=hasher.run, args=(slow_hash,))
+    worker.start()
+    started.wait(timeout=5)
+
+    with pytest.raises(PasswordHasherBusyError):
+        hasher.run(lambda: None)
+
+    release.set()
+    worker.join()
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["completed"] == 1
+
+
+def test_password_hasher_releases_slot_when_submit_fails():
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    hasher._executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        hasher.run(lambda: None)
+
+    assert hasher.pending == 0
+    assert hasher.stats()["queued"] == 0
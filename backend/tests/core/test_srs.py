@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from app.core.srs import MIN_EASE, Schedule, next_schedule, review_card
+from app.models.review_card import ReviewCard
+
+NEW = Schedule(repetitions=0, interval_days=0, ease_factor=2.5, lapses=0)
+
+
+def test_intervals_grow_with_correct_answers():
+    schedule = NEW
+    intervals = []
+    for _ in range(4):
+        schedule = next_schedule(schedule, 4)
+        intervals.append(schedule.interval_days)
+    assert intervals == [1, 6, 15, 38]
+    assert schedule.ease_factor == 2.5
+
+
+def test_failed_review_relearns_the_card():
+    schedule = next_schedule(Schedule(3, 15, 2.5, 0), 1)
+    assert schedule.repetitions == 0
+    assert schedule.interval_days == 1
+    assert schedule.lapses == 1
+    assert schedule.ease_factor < 2.5
+
+
+def test_ease_factor_has_a_floor():
+    schedule = NEW
+    for _ in range(10):
+        schedule = next_schedule(schedule, 0)
+    assert schedule.ease_factor == MIN_EASE
+
+
+def test_review_card_moves_the_due_date():
+    card = ReviewCard()
+    reviewed_at = datetime(2024, 3, 10, 12, 0)
+    review_card(card, 5, reviewed_at)
+    review_card(card, 5, reviewed_at)
+    assert card.repetitions == 2
+    assert card.last_reviewed_at == reviewed_at
+    assert card.due_at == datetime(2024, 3, 16, 12, 0)
@@ -0,0 +1,135 @@
+from datetime import date, datetime
+
+from app.core.stats import (
+    get_activity_series,
+    get_dashboard_stats,
+    record_activity,
+    refresh_daily_stats,
+)
+from app.models.daily_stats import DailyStats
+from app.models.user import User
+from app.models.word import ApprovalStatus, Word
+
+NOW = datetime(2024, 3, 10, 12, 0)
+
+
+def add_rows(db_session, created_at, users=0, words=0):
+    db_session.add_all(
+        User(
+            email=f"user{created_at:%m%d%H}{i}@example.com",
+            created_at=created_at,
+        )
+        for i in range(users)
+    )
+    db_session.add_all(
+        Word(
+            greek_word=f"λέξη{i}",
+            word_type="noun",
+            approval_status=ApprovalStatus.APPROVED,
+            created_at=created_at,
+        )
+        for i in range(words)
+    )
+    db_session.commit()
+
+
+def seed(db_session):
+    add_rows(db_session, datetime(2024, 1, 20), users=1, words=2)
+    add_rows(db_session, datetime(2024, 2, 5), users=2, words=4)
+    add_rows(db_session, datetime(2024, 3, 2), users=3, words=5)
+    add_rows(db_session, datetime(2024, 3, 9, 23, 59), users=1)
+    # Today is still open and never rolled up
+    add_rows(db_session, datetime(2024, 3, 10, 8), users=1, words=1)
+
+
+def test_refresh_rolls_up_closed_days(db_session):
+    seed(db_session)
+
+    assert refresh_daily_stats(db_session, today=NOW.date()) == 50
+    rows = {row.day: row for row in db_session.query(DailyStats)}
+    assert min(rows) == date(2024, 1, 20)
+    assert max(rows) == date(2024, 3, 9)
+    assert rows[date(2024, 2, 5)].new_words == 4
+    assert rows[date(2024, 3, 9)].new_users == 1
+    assert rows[date(2024, 3, 9)].total_users == 7
+    assert rows[date(2024, 3, 9)].total_words == 11
+
+    # Later refreshes only revisit the last rolled-up day onwards
+    assert refresh_daily_stats(db_session, today=NOW.date()) == 1
+    assert refresh_daily_stats(db_session, today=date(2024, 3, 12)) == 3
+
+
+def test_dashboard_stats_match_with_and_without_rollup(db_session):
+    seed(db_session)
+    db_session.add(
+        User(
+            email="active@example.com",
+            created_at=datetime(2023, 12, 1),
+            last_login=NOW,
+        )
+    )
+    db_session.commit()
+
+    live = get_dashboard_stats(db_session, now=NOW)
+    refresh_daily_stats(db_session, today=NOW.date())
+    assert get_dashboard_stats(db_session, now=NOW) == live
+
+    assert live["total_users"] == 9
+    assert live["active_users"] == 1
+    assert live["total_content"] == 12
+    # March so far against February: 5 vs 2 users and 6 vs 4 words
+    assert live["user_growth"] == 150.0
+    assert live["content_growth"] == 50.0
+
+
+def test_dashboard_stats_read_rollup_not_history(db_session, statements):
+    seed(db_session)
+    refresh_daily_stats(db_session, today=NOW.date())
+    statements.clear()
+
+    get_dashboard_stats(db_session, now=NOW)
+    assert len(statements) == 2
+    # Only rows created after the last rolled-up day are counted live
+    assert all("created_at >=" in s for s in statements if "FROM users" in s)
+
+
+def test_activity_series_combines_rollup_counters_and_live_rows(db_session):
+    seed(db_session)
+    refresh_daily_stats(db_session, today=date(2024, 3, 5))
+    record_activity(db_session, logins=2, day=date(2024, 3, 4))
+    record_activity(db_session, logins=1, approvals=4, day=date(2024, 3, 9))
+    record_activity(db_session, approvals=1, day=date(2024, 3, 9))
+    db_session.commit()
+
+    points = {
+        point["period"]: point
+        for point in get_activity_series(db_session, days=10, now=NOW)
+    }
+    assert len(points) == 10
+    # Rolled-up day
+    assert points[date(2024, 3, 2)]["signups"] == 3
+    assert points[date(2024, 3, 2)]["submissions"] == 5
+    assert points[date(2024, 3, 4)]["logins"] == 2
+    # Days after the rollup are counted live, next to their counters
+    assert points[date(2024, 3, 9)] == {
+        "period": date(2024, 3, 9),
+        "signups": 1,
+        "logins": 1,
+        "submissions": 0,
+        "approvals": 5,
+    }
+    assert points[date(2024, 3, 10)]["signups"] == 1
+
+    # Counter rows do not count as rolled up
+    assert refresh_daily_stats(db_session, today=NOW.date()) == 6
+    assert get_dashboard_stats(db_session, now=NOW)["total_users"] == 8
+
+    weeks = get_activity_series(db_session, "week", days=14, now=NOW)
+    # 2024-03-10 is a Sunday, so the weeks start on 02-26 and 03-04
+    assert [week["period"] for week in weeks] == [
+        date(2024, 2, 26),
+        date(2024, 3, 4),
+    ]
+    assert weeks[0]["signups"] == 3
+    assert weeks[1]["logins"] == 3
+    assert weeks[1]["approvals"] == 5
@@ -1,9 +1,16 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
-from app.db.database import SessionLocal, get_db
+from app.db.database import (
+    InstrumentedQueuePool,
+    SessionLocal,
+    get_db,
+    get_pool_stats,
+)
 
 
 def test_get_db_success():
@@ -63,3 +70,33 @@ def test_session_local_configuration():
     assert SessionLocal.kw["autocommit"] is False
     assert SessionLocal.kw["autoflush"] is False
     assert SessionLocal.kw["bind"] is not None
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts():
+    """Test pool metrics count checkouts, overflow and timeouts"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    first = engine.connect()
+    second = engine.connect()
+
+    stats = get_pool_stats(engine.pool)
+    assert stats["checkouts"] == 2
+    assert stats["checked_out"] == 2
+    assert stats["overflow_in_use"] == 1
+
+    # Pool and overflow are exhausted, so the next checkout times out
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    first.close()
+    second.close()
+    stats = get_pool_stats(engine.pool)
+    assert stats["timeouts"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["wait_time_max_seconds"] >= 0.01
+    engine.dispose()
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.api.words import flashcard_columns
+from app.core.search import word_search_filter
+from app.models.meaning import Meaning
+from app.models.user import User
+from app.models.word import Word
+
+
+def query_plan(db_session, statement) -> str:
+    compiled = statement.compile(
+        db_session.get_bind(), compile_kwargs={"literal_binds": True}
+    )
+    rows = db_session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {compiled}"
+    )
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            select(Meaning).where(Meaning.word_id == 1),
+            "SEARCH meanings USING INDEX ix_meanings_word_id (word_id=?)",
+        ),
+        # The primary meaning of flashcards and review cards
+        (
+            select(*flashcard_columns()).where(Word.id == 1),
+            "SEARCH meanings USING INDEX ix_meanings_word_id (word_id=?)",
+        ),
+        # Searching meanings probes them per word
+        (
+            select(Word.id).where(word_search_filter("hello", "contains")),
+            "SEARCH meanings USING INDEX ix_meanings_word_id (word_id=?)",
+        ),
+        (
+            select(Word).where(Word.created_by == 1),
+            "SEARCH words USING INDEX ix_words_created_by (created_by=?)",
+        ),
+        (
+            select(Word).where(Word.word_type == "verb"),
+            "SEARCH words USING INDEX ix_words_word_type (word_type=?)",
+        ),
+        (
+            select(Word).where(Word.gender == "feminine"),
+            "SEARCH words USING INDEX ix_words_gender (gender=?)",
+        ),
+        (
+            select(Word).order_by(Word.created_at.desc()).limit(10),
+            "SCAN words USING INDEX ix_words_created_at",
+        ),
+        (
+            select(User).order_by(User.created_at.desc()).limit(10),
+            "SCAN users USING INDEX ix_users_created_at",
+        ),
+        (
+            select(User.id).where(User.last_login >= datetime(2024, 1, 1)),
+            "SEARCH users USING COVERING INDEX ix_users_last_login "
+            "(last_login>?)",
+        ),
+    ],
+)
+def test_planner_uses_index(db_session, statement, expected):
+    assert expected in query_plan(db_session, statement)
@@ -1,10 +1,16 @@
 export const wordService = {
-  getPendingWords: jest.fn().mockResolvedValue([]),
+  getPendingWords: jest
+    .fn()
+    .mockResolvedValue({ items: [], total: 0, next_cursor: null }),
   getAllWords: jest.fn().mockResolvedValue([]),
   createWord: jest.fn().mockResolvedValue({}),
   updateWord: jest.fn().mockResolvedValue({}),
+  patchWord: jest.fn().mockResolvedValue({}),
   deleteWord: jest.fn().mockResolvedValue({}),
   getWordById: jest.fn().mockResolvedValue({}),
+  getFlashcards: jest.fn().mockResolvedValue([]),
   approveWord: jest.fn().mockResolvedValue({}),
   rejectWord: jest.fn().mockResolvedValue({}),
+  bulkApproveWords: jest.fn().mockResolvedValue({}),
+  bulkRejectWords: jest.fn().mockResolvedValue({}),
 };
@@ -11,4 +11,5 @@ export const API_ENDPOINTS = {
     me: `${API_URL}/auth/users/me`,
   },
   admin: `${API_URL}/admin`,
+  reviews: `${API_URL}/reviews`,
 } as const;
@@ -24,8 +24,9 @@ export const AdminProvider: React.FC<{ children: React.ReactNode }> = ({
   const fetchPendingCount = useCallback(async () => {
     if (user?.role === "admin") {
       try {
-        const pendingWords = await wordService.getPendingWords();
-        setPendingCount(pendingWords.length);
+        // Only the total is needed, so fetch the smallest page
+        const pendingWords = await wordService.getPendingWords(null, 1);
+        setPendingCount(pendingWords.total);
       } catch (error) {
         console.error("Error fetching pending words count:", error);
       }
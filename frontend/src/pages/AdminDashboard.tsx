@@ -62,6 +62,7 @@ const AdminDashboard: React.FC = () => {
   const [recentUsers, setRecentUsers] = useState<RecentUser[]>([]);
   const [recentContent, setRecentContent] = useState<RecentContent[]>([]);
   const [pendingWords, setPendingWords] = useState<Word[]>([]);
+  const [pendingCursor, setPendingCursor] = useState<string | null>(null);
   const [pendingSearch, setPendingSearch] = useState("");
   const [snackbar, setSnackbar] = useState<{
     open: boolean;
@@ -90,7 +91,8 @@ const AdminDashboard: React.FC = () => {
       setStats(statsData);
       setRecentUsers(usersData);
       setRecentContent(contentData);
-      setPendingWords(pendingWordsData);
+      setPendingWords(pendingWordsData.items);
+      setPendingCursor(pendingWordsData.next_cursor ?? null);
     } catch (error) {
       console.error("Error fetching dashboard data:", error);
     } finally {
@@ -102,6 +104,16 @@ const AdminDashboard: React.FC = () => {
     fetchDashboardData();
   }, []);
 
+  const handleLoadMorePending = async () => {
+    try {
+      const data = await wordService.getPendingWords(pendingCursor);
+      setPendingWords((words) => [...words, ...data.items]);
+      setPendingCursor(data.next_cursor ?? null);
+    } catch (error) {
+      console.error("Error fetching pending words:", error);
+    }
+  };
+
   const handleRefresh = () => {
     fetchDashboardData();
   };
@@ -501,6 +513,11 @@ const AdminDashboard: React.FC = () => {
                 </ListItem>
               )}
             </List>
+            {pendingCursor && (
+              <Box sx={{ px: 2, pb: 2, textAlign: "center" }}>
+                <Button onClick={handleLoadMorePending}>Load more</Button>
+              </Box>
+            )}
           </Card>
         </Grid>
 
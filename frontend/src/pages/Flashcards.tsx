@@ -12,20 +12,32 @@ import {
   useTheme,
 } from "@mui/material";
 import { alpha } from "@mui/material/styles";
-import { useCallback, useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
+import { reviewService } from "../services/reviewService";
 import { wordService } from "../services/wordService";
-import { Word, WordType } from "../types";
+import { Flashcard, ReviewSubmission, WordType } from "../types";
 import { getGenderColor, getBorderColor } from "../utils/chipColors";
 
+const DECK_SIZE = 50;
+// Graded reviews are sent in batches of this size, and when leaving
+const REVIEW_BATCH_SIZE = 10;
+const GRADES = [
+  { label: "Again", grade: 1 },
+  { label: "Hard", grade: 3 },
+  { label: "Good", grade: 4 },
+  { label: "Easy", grade: 5 },
+];
+
 const Flashcards = () => {
   const theme = useTheme();
   const isMobile = useMediaQuery(theme.breakpoints.down("sm"));
 
-  const [words, setWords] = useState<Word[]>([]);
+  const [words, setWords] = useState<Flashcard[]>([]);
   const [currentIndex, setCurrentIndex] = useState(0);
   const [isFlipped, setIsFlipped] = useState(false);
+  const pendingReviews = useRef<ReviewSubmission[]>([]);
 
-  const shuffleWords = (wordArray: Word[]) => {
+  const shuffleWords = (wordArray: Flashcard[]) => {
     const shuffled = [...wordArray];
     for (let i = shuffled.length - 1; i > 0; i--) {
       const j = Math.floor(Math.random() * (i + 1));
@@ -34,16 +46,37 @@ const Flashcards = () => {
     return shuffled;
   };
 
+  const flushReviews = useCallback(async () => {
+    const reviews = pendingReviews.current;
+    if (reviews.length === 0) return;
+    pendingReviews.current = [];
+    try {
+      await reviewService.submitReviews(reviews);
+    } catch (error) {
+      console.error("Error submitting reviews:", error);
+      pendingReviews.current = [...reviews, ...pendingReviews.current];
+    }
+  }, []);
+
   const fetchWords = useCallback(async () => {
     try {
-      const response = await wordService.getWords();
-      setWords(shuffleWords(response.items));
+      await flushReviews();
+      // Cards due for review come first, topped up with words the user
+      // has not studied yet, which the server returns in random order
+      const due = await reviewService.getDueCards(DECK_SIZE);
+      const unseen =
+        due.length < DECK_SIZE
+          ? await wordService.getFlashcards(DECK_SIZE - due.length, {
+              unseen: true,
+            })
+          : [];
+      setWords([...due, ...unseen]);
       setCurrentIndex(0);
       setIsFlipped(false);
     } catch (error) {
       console.error("Error fetching words:", error);
     }
-  }, []);
+  }, [flushReviews]);
 
   const handleShuffle = () => {
     setWords(shuffleWords(words));
@@ -53,7 +86,10 @@ const Flashcards = () => {
 
   useEffect(() => {
     fetchWords();
-  }, [fetchWords]);
+    return () => {
+      flushReviews();
+    };
+  }, [fetchWords, flushReviews]);
 
   const handleNext = () => {
     if (isFlipped) {
@@ -81,6 +117,18 @@ const Flashcards = () => {
     setIsFlipped(!isFlipped);
   };
 
+  const handleGrade = (grade: number) => {
+    pendingReviews.current.push({
+      word_id: words[currentIndex].id,
+      grade,
+      reviewed_at: new Date().toISOString(),
+    });
+    if (pendingReviews.current.length >= REVIEW_BATCH_SIZE) {
+      flushReviews();
+    }
+    handleNext();
+  };
+
   if (words.length === 0) {
     return (
       <Box sx={{ p: { xs: 2, sm: 4 }, textAlign: "center" }}>
@@ -284,8 +332,7 @@ const Flashcards = () => {
                 maxWidth: "100%",
               }}
             >
-              {currentWord.meanings.find((m) => m.is_primary)
-                ?.english_meaning || currentWord.meanings[0]?.english_meaning}
+              {currentWord.meaning}
             </Typography>
             {currentWord.notes && (
               <Typography
@@ -304,6 +351,28 @@ const Flashcards = () => {
           </CardContent>
         </Box>
       </Card>
+
+      {isFlipped && (
+        <Box
+          sx={{
+            display: "flex",
+            gap: 1,
+            justifyContent: "center",
+            mt: { xs: 1, sm: 2 },
+          }}
+        >
+          {GRADES.map(({ label, grade }) => (
+            <Button
+              key={grade}
+              variant="outlined"
+              size={isMobile ? "small" : "medium"}
+              onClick={() => handleGrade(grade)}
+            >
+              {label}
+            </Button>
+          ))}
+        </Box>
+      )}
     </Box>
   );
 };
@@ -72,6 +72,7 @@ const WordForm: React.FC<WordFormProps> = ({
         gender: editWord.gender || Gender.MASCULINE,
         notes: editWord.notes || "",
         meanings: editWord.meanings.map((m) => ({
+          id: m.id,
           english_meaning: m.english_meaning,
           is_primary: m.is_primary,
         })),
@@ -9,6 +9,19 @@ export interface DashboardStats {
   content_growth: number;
 }
 
+export interface ActivityPoint {
+  period: string;
+  signups: number;
+  logins: number;
+  submissions: number;
+  approvals: number;
+}
+
+export interface ActivitySeries {
+  interval: "day" | "week";
+  points: ActivityPoint[];
+}
+
 export interface RecentUser {
   id: number;
   name: string;
@@ -33,6 +46,16 @@ class AdminService {
     return response.data;
   }
 
+  async getAnalytics(
+    interval: "day" | "week" = "day",
+    days = 30,
+  ): Promise<ActivitySeries> {
+    const response = await api.get<ActivitySeries>(
+      `${API_ENDPOINTS.admin}/analytics?interval=${interval}&days=${days}`,
+    );
+    return response.data;
+  }
+
   async getRecentUsers(): Promise<RecentUser[]> {
     const response = await api.get<RecentUser[]>(
       `${API_ENDPOINTS.admin}/users`,
@@ -0,0 +1,21 @@
+import { API_ENDPOINTS } from "../config";
+import { DueCard, ReviewBatchResult, ReviewSubmission } from "../types";
+import { api } from "./apiClient";
+
+export const reviewService = {
+  async getDueCards(limit = 50): Promise<DueCard[]> {
+    const response = await api.get<DueCard[]>(
+      `${API_ENDPOINTS.reviews}/due?limit=${limit}`,
+    );
+    return response.data;
+  },
+
+  async submitReviews(
+    reviews: ReviewSubmission[],
+  ): Promise<ReviewBatchResult> {
+    const response = await api.post<ReviewBatchResult>(API_ENDPOINTS.reviews, {
+      reviews,
+    });
+    return response.data;
+  },
+};
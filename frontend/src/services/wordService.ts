@@ -1,5 +1,5 @@
 import { API_ENDPOINTS } from "../config";
-import { Gender, Word, WordFormData, WordType } from "../types";
+import { Flashcard, Gender, Word, WordFormData, WordType } from "../types";
 import { api } from "./apiClient";
 
 interface WordFilters {
@@ -11,12 +11,19 @@ interface WordFilters {
   includePending?: boolean;
 }
 
+interface BulkModerationResult {
+  approval_status: string;
+  updated: number;
+  results: { id: number; status: "updated" | "not_found" }[];
+}
+
 interface PaginatedResponse {
   items: Word[];
   total: number;
   page: number;
   size: number;
   pages: number;
+  next_cursor?: string | null;
 }
 
 export const wordService = {
@@ -45,6 +52,15 @@ export const wordService = {
     return response.data;
   },
 
+  // Only the fields given are written
+  async patchWord(id: number, changes: Partial<WordFormData>): Promise<Word> {
+    const response = await api.patch<Word>(
+      `${API_ENDPOINTS.words}/${id}`,
+      changes,
+    );
+    return response.data;
+  },
+
   async deleteWord(id: number): Promise<void> {
     await api.delete(`${API_ENDPOINTS.words}/${id}`);
   },
@@ -54,9 +70,31 @@ export const wordService = {
     return response.data;
   },
 
+  async getFlashcards(
+    count = 20,
+    filters?: { wordType?: WordType; gender?: Gender; unseen?: boolean },
+  ): Promise<Flashcard[]> {
+    const params = new URLSearchParams({ count: count.toString() });
+    if (filters?.wordType) params.append("word_type", filters.wordType);
+    if (filters?.gender) params.append("gender", filters.gender);
+    if (filters?.unseen) params.append("unseen", "true");
+    const response = await api.get<Flashcard[]>(
+      `${API_ENDPOINTS.words}/flashcards?${params.toString()}`,
+    );
+    return response.data;
+  },
+
   // Admin only methods
-  async getPendingWords(): Promise<Word[]> {
-    const response = await api.get<Word[]>(`${API_ENDPOINTS.words}/pending`);
+  async getPendingWords(
+    cursor?: string | null,
+    size?: number,
+  ): Promise<PaginatedResponse> {
+    const params = new URLSearchParams();
+    if (cursor) params.append("cursor", cursor);
+    if (size) params.append("size", size.toString());
+    const response = await api.get<PaginatedResponse>(
+      `${API_ENDPOINTS.words}/pending?${params.toString()}`,
+    );
     return response.data;
   },
 
@@ -75,4 +113,20 @@ export const wordService = {
     );
     return response.data;
   },
+
+  async bulkApproveWords(ids: number[]): Promise<BulkModerationResult> {
+    const response = await api.post<BulkModerationResult>(
+      `${API_ENDPOINTS.words}/bulk/approve`,
+      { ids },
+    );
+    return response.data;
+  },
+
+  async bulkRejectWords(ids: number[]): Promise<BulkModerationResult> {
+    const response = await api.post<BulkModerationResult>(
+      `${API_ENDPOINTS.words}/bulk/reject`,
+      { ids },
+    );
+    return response.data;
+  },
 };
@@ -49,7 +49,43 @@ export interface Word {
   submitter?: UserOut;
 }
 
+export interface Flashcard {
+  id: number;
+  greek_word: string;
+  word_type: WordType;
+  gender?: Gender;
+  notes?: string;
+  meaning?: string;
+}
+
+export interface DueCard extends Flashcard {
+  due_at: string;
+  interval_days: number;
+  repetitions: number;
+}
+
+// Recall grade from 0 (forgotten) to 5 (perfect)
+export interface ReviewSubmission {
+  word_id: number;
+  grade: number;
+  reviewed_at?: string;
+}
+
+export interface ReviewOutcome {
+  word_id: number;
+  status: "reviewed" | "not_found";
+  due_at?: string;
+  interval_days?: number;
+}
+
+export interface ReviewBatchResult {
+  reviewed: number;
+  results: ReviewOutcome[];
+}
+
 export interface MeaningFormData {
+  // Set for meanings that already exist, so updates keep their ids
+  id?: number;
   english_meaning: string;
   is_primary: boolean;
 }
@@ -60,6 +96,7 @@ export interface WordFormData {
   gender?: Gender;
   notes?: string;
   meanings: {
+    id?: number;
     english_meaning: string;
     is_primary: boolean;
   }[];